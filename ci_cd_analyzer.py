@@ -8,48 +8,439 @@ import os
 import sys
 import json
 import subprocess
+import shutil
+import tempfile
 import re
+import logging
+import bisect
+import hashlib
+import mmap
+import functools
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger('ci_cd_analyzer')
+
+# Optional YAML parser for pubspec.yaml (falls back to substring checks)
+try:
+    import yaml
+    HAS_YAML = True
+    YAML_LOADER = getattr(yaml, 'CSafeLoader', None) or yaml.SafeLoader
+except ImportError:
+    HAS_YAML = False
+
+# Optional linear-time (DFA) regex engine for rewriting sensitive data
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Optional Aho-Corasick automaton for the sensitive-data keyword prefilter
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Patterns that indicate hard-coded credentials in Dart sources (ASCII, scanned as bytes)
+SENSITIVE_DATA_RE = re.compile(
+    rb'(?:password|api[_-]*key|secret|token|private[_-]*key)\s*=\s*[\'"]',
+    re.IGNORECASE
+)
+
+# Generated, tooling and platform directories that never hold analyzable Dart sources
+SKIPPED_SCAN_DIRS = frozenset(['.dart_tool', 'build', '.git', '.idea', 'ios', 'android'])
+
+# Masks hard-coded credentials in place: key, assignment, then a double- or
+# single-quoted value (no backreferences, so RE2 can run it as a DFA)
+SENSITIVE_DATA_SUB_RE = (re2 if HAS_RE2 else re).compile(
+    r'(?i)(password|api[_-]*key|secret|token|private[_-]*key)(\s*=\s*)'
+    r'(?:"([^"\n]*)"|\'([^\'\n]*)\')'
+)
+
+# Literals every sensitive-data match contains (lowercase), checked before any regex runs
+SENSITIVE_KEYWORDS = ('password', 'secret', 'token', 'key')
+if HAS_AHOCORASICK:
+    SENSITIVE_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for keyword in SENSITIVE_KEYWORDS:
+        SENSITIVE_KEYWORD_AUTOMATON.add_word(keyword, keyword)
+    SENSITIVE_KEYWORD_AUTOMATON.make_automaton()
+
+def contains_sensitive_keyword(text: str) -> bool:
+    """Cheap check for any sensitive-data keyword, case-insensitively"""
+    lowered = text.lower()
+    if HAS_AHOCORASICK:
+        return next(SENSITIVE_KEYWORD_AUTOMATON.iter(lowered), None) is not None
+    return any(keyword in lowered for keyword in SENSITIVE_KEYWORDS)
+
+def mask_sensitive_match(match) -> str:
+    """Replacement for SENSITIVE_DATA_SUB_RE that wraps the value in ***"""
+    value = match.group(3) if match.group(3) is not None else match.group(4)
+    if len(value) >= 6 and value.startswith('***') and value.endswith('***'):
+        return match.group(0)  # already masked
+    if match.group(3) is not None:
+        return f'{match.group(1)}{match.group(2)}"***{match.group(3)}***"'
+    return f"{match.group(1)}{match.group(2)}'***{match.group(4)}***'"
+
+# Files at least this large are memory-mapped for scanning instead of read
+MMAP_SCAN_THRESHOLD = 16 * 1024
+
+# Per-file sensitive-data results kept between runs, keyed on content hashes
+SCAN_CACHE_FILE = ".dart_tool/ci_cd_analyzer_cache.json"
+
+# Read-only flutter commands the analyzers run, with their timeouts in seconds
+PUB_OUTDATED_COMMAND = ("flutter", "pub", "outdated", "--json")
+TEST_COVERAGE_COMMAND = ("flutter", "test", "--coverage")
+PUB_DEPS_COMMAND = ("flutter", "pub", "deps")
+PUB_DEPS_JSON_COMMAND = ("flutter", "pub", "deps", "--json")
+ANALYSIS_COMMAND_TIMEOUTS = {
+    PUB_OUTDATED_COMMAND: 30,
+    TEST_COVERAGE_COMMAND: 60,
+    PUB_DEPS_COMMAND: 30,
+    PUB_DEPS_JSON_COMMAND: 60,
+}
+
+# Commands where only the exit code matters; their output is not captured
+EXIT_CODE_ONLY_COMMANDS = frozenset([TEST_COVERAGE_COMMAND])
+
+# Dependency versions with known issues, matched in `flutter pub deps` output
+VULNERABLE_PACKAGES = [
+    'http: ^0.13.5',  # Known vulnerabilities
+    'path: ^1.8.3',  # Check for newer versions
+]
+VULNERABLE_PACKAGE_RE = re.compile('|'.join(re.escape(package) for package in VULNERABLE_PACKAGES))
+
+# Packages that noticeably increase app size and startup time
+HEAVY_PACKAGES = (
+    'firebase_core',
+    'google_maps_flutter',
+    'camera',
+    'video_player',
+)
+
+# Start of a top-level key in a YAML document
+TOP_LEVEL_KEY_RE = re.compile(r'^[^\s#]', re.MULTILINE)
+
+# Fixes applied by patching a file's content: issue type -> (default file, success, failure)
+FILE_PATCH_FIXES = {
+    "timeout_missing": (".github/workflows/ci.yml", "Added timeout-minutes: 30 to jobs", "Failed to fix timeout"),
+    "cache_missing": (".github/workflows/ci.yml", "Added Flutter caching to workflow", "Failed to add caching"),
+    "error_handling_missing": (".github/workflows/ci.yml", "Added continue-on-error: true to steps", "Failed to add error handling"),
+    "artifact_upload_missing": (".github/workflows/ci.yml", "Added artifact upload to workflow", "Failed to add artifact upload"),
+    "linting_missing": ("pubspec.yaml", "Added flutter_lints to dev_dependencies", "Failed to add linting"),
+    "test_dependencies_missing": ("pubspec.yaml", "Added flutter_test to dev_dependencies", "Failed to add test dependencies"),
+    "build_runner_missing": ("pubspec.yaml", "Added build_runner to dev_dependencies", "Failed to add build_runner"),
+    "sdk_constraint_missing": ("pubspec.yaml", "Added SDK constraint to pubspec.yaml", "Failed to add SDK constraint"),
+    "image_caching_missing": ("pubspec.yaml", "Added cached_network_image to dependencies", "Failed to add image caching"),
+    "heavy_dependency": ("pubspec.yaml", "Added lazy loading recommendation for {package}",
+                         "Failed to add lazy loading recommendation for {package}"),
+}
+
+# One "Issues Found" entry in the markdown report, including its trailing blank line
+ISSUE_TMPL = """{i}. **{sev}** - {desc}
+   Location: {file}
+   Fix: {fix}
+"""
+
+# One numbered "Fixes Applied" or "Recommendations" entry, including its trailing blank line
+LIST_ITEM_TMPL = "{}. {}\n"
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file's content"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def search_sensitive_data(path: Path) -> bool:
+    """Check whether a file matches any sensitive data pattern"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_SCAN_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return SENSITIVE_DATA_RE.search(data) is not None
+        return SENSITIVE_DATA_RE.search(f.read()) is not None
+
+@functools.lru_cache(maxsize=None)
+def section_header_re(section: str):
+    """Compiled pattern for a top-level YAML section's header line"""
+    return re.compile(rf'^{re.escape(section)}:[^\n]*', re.MULTILINE)
+
+@functools.lru_cache(maxsize=None)
+def section_entry_re(package: str):
+    """Compiled pattern for an indented package entry line"""
+    return re.compile(rf'^[ \t]+{re.escape(package)}[ \t]*:[^\n]*', re.MULTILINE)
+
+def find_section(content: str, section: str) -> Optional[Tuple[int, int]]:
+    """Offsets of a top-level YAML section's header line end and body end"""
+    header = section_header_re(section).search(content)
+    if header is None:
+        return None
+    next_key = TOP_LEVEL_KEY_RE.search(content, header.end() + 1)
+    return header.end(), next_key.start() if next_key else len(content)
+
+def find_section_entry(content: str, section: str, package: str):
+    """Match for a package's entry line inside a top-level YAML section"""
+    bounds = find_section(content, section)
+    if bounds is None:
+        return None
+    return section_entry_re(package).search(content, *bounds)
+
+def insert_under_section(content: str, section: str, package: str, lines: List[str]) -> str:
+    """Insert lines at the top of a top-level YAML section unless package is already listed there"""
+    insertion = '\n'.join(lines)
+    bounds = find_section(content, section)
+    if bounds is None:
+        return f"{content.rstrip()}\n\n{section}:\n{insertion}\n"
+    # Look for the entry within the bounds already found instead of rescanning for the header
+    if section_entry_re(package).search(content, *bounds) is not None:
+        return content
+    header_end = bounds[0]
+    return f"{content[:header_end]}\n{insertion}{content[header_end:]}"
+
+def insert_after_section_entry(content: str, section: str, package: str, lines: List[str]) -> str:
+    """Insert lines right after a package's entry in a top-level YAML section"""
+    insertion = '\n'.join(lines)
+    entry = find_section_entry(content, section, package)
+    if entry is None or content.startswith('\n' + insertion, entry.end()):
+        return content
+    return f"{content[:entry.end()]}\n{insertion}{content[entry.end():]}"
+
+def scrub_sensitive_file(file_path: str) -> bool:
+    """Mask sensitive data line by line into a temp file, replacing the original if anything changed"""
+    # Every masked value also matches the byte-level scan pattern, so files
+    # without a hit are left alone before any decoding or temp file creation
+    if not search_sensitive_data(file_path):
+        return False
+    directory = os.path.dirname(os.path.abspath(file_path))
+    changed = False
+    with open(file_path, 'r', encoding='utf-8', newline='') as source, \
+            tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='', dir=directory, delete=False) as target:
+        try:
+            for line in source:
+                # Most lines mention none of the keywords, so skip the regex for them
+                if contains_sensitive_keyword(line):
+                    masked = SENSITIVE_DATA_SUB_RE.sub(mask_sensitive_match, line)
+                    if masked != line:
+                        line = masked
+                        changed = True
+                target.write(line)
+        except BaseException:
+            target.close()
+            os.unlink(target.name)
+            raise
+    
+    if not changed:
+        os.unlink(target.name)
+        return False
+    shutil.copymode(file_path, target.name)
+    os.replace(target.name, file_path)
+    return True
+
+def fix_sensitive_file(file_path: str) -> str:
+    """Scrub one file and describe the outcome (module-level so process pools can run it)"""
+    try:
+        if not scrub_sensitive_file(file_path):
+            return f"No sensitive data found in {file_path}"
+        
+        return f"Removed sensitive data from {file_path}"
+        
+    except Exception as e:
+        return f"Failed to remove sensitive data from {file_path}: {str(e)}"
+
+def insert_after_matching_lines(content: str, marker: str, lines: List[str]) -> str:
+    """Insert lines after every line containing marker, splicing around each match"""
+    insertion = '\n'.join(lines)
+    parts = []
+    start = 0
+    while True:
+        index = content.find(marker, start)
+        if index < 0:
+            break
+        line_end = content.find('\n', index)
+        if line_end < 0:
+            parts.append(content[start:] + '\n' + insertion)
+            start = len(content)
+            break
+        parts.append(content[start:line_end + 1])
+        parts.append(insertion + '\n')
+        start = line_end + 1
+    if not parts:
+        return content
+    parts.append(content[start:])
+    return ''.join(parts)
 
 class CICDAnalyzer:
     def __init__(self, project_path: str = "."):
         self.project_path = Path(project_path)
+        self.pubspec_path = self.project_path / "pubspec.yaml"
+        self.test_path = self.project_path / "test"
+        self.integration_test_path = self.project_path / "integration_test"
+        self.scan_cache_path = self.project_path / SCAN_CACHE_FILE
         self.issues = []
         self.fixes_applied = []
-        self.analysis_report = {
-            "timestamp": datetime.now().isoformat(),
-            "project_path": str(project_path),
-            "issues": [],
-            "fixes_applied": [],
-            "recommendations": []
-        }
+        self._line_index_content = None
+        self._line_offsets = []
+        self._command_futures = {}
+        self._scan_results = {}
+        self._pubspec_mtime = None
+        self._analysis_report = None
+        # Resolve the flutter executable once rather than searching PATH on every command
+        self._flutter = shutil.which('flutter') or 'flutter'
         
+    @property
+    def analysis_report(self) -> Dict[str, Any]:
+        """Analysis report, created with a current timestamp on first use"""
+        if self._analysis_report is None:
+            self._analysis_report = {
+                "timestamp": datetime.now().isoformat(),
+                "project_path": str(self.project_path),
+                "issues": [],
+                "fixes_applied": [],
+                "recommendations": []
+            }
+        return self._analysis_report
+    
+    @functools.cached_property
+    def _pubspec_content(self) -> Optional[str]:
+        """pubspec.yaml content, read once and shared by the analyzers and fixes"""
+        if not self.pubspec_path.exists():
+            return None
+        self._pubspec_mtime = self.pubspec_path.stat().st_mtime_ns
+        return self.pubspec_path.read_text(encoding='utf-8', errors='replace')
+    
+    @functools.cached_property
+    def _pubspec_doc(self) -> Optional[Dict[str, Any]]:
+        """Parsed pubspec.yaml, or None when it cannot be parsed"""
+        if not HAS_YAML or self._pubspec_content is None:
+            return None
+        try:
+            doc = yaml.load(self._pubspec_content, Loader=YAML_LOADER)
+        except yaml.YAMLError:
+            return None
+        return doc if isinstance(doc, dict) else None
+    
+    def _pubspec_section(self, section: str) -> Dict[str, Any]:
+        """Return a top-level mapping from the parsed pubspec.yaml"""
+        value = (self._pubspec_doc or {}).get(section)
+        return value if isinstance(value, dict) else {}
+    
+    def _pubspec_declares(self, package: str) -> bool:
+        """Check whether pubspec.yaml declares a package or dev package"""
+        if self._pubspec_doc is None:
+            return f'{package}:' in (self._pubspec_content or '')
+        return (package in self._pubspec_section('dependencies')
+                or package in self._pubspec_section('dev_dependencies'))
+    
+    @functools.cached_property
+    def _project_files(self) -> List[str]:
+        """Every source file under the project, collected in a single tree walk"""
+        files = []
+        for root, dirs, filenames in os.walk(self.project_path, followlinks=False):
+            dirs[:] = [d for d in dirs if d not in SKIPPED_SCAN_DIRS]
+            files.extend(os.path.join(root, filename) for filename in filenames)
+        return files
+    
+    @functools.cached_property
+    def _dart_files(self) -> List[Path]:
+        """Dart sources taken from the shared project file list"""
+        return [Path(path) for path in self._project_files if path.endswith('.dart')]
+    
+    @functools.cached_property
+    def _test_files(self) -> List[Path]:
+        """*_test.dart files under the test/ directory"""
+        return [
+            path for path in self._dart_files
+            if path.name.endswith('_test.dart')
+            and self.test_path in path.parents
+        ]
+    
     def analyze_ci_cd_failure(self, workflow_file: str = ".github/workflows") -> Dict[str, Any]:
         """Analyze CI/CD workflow for potential issues"""
-        print(f"🔍 Analyzing CI/CD workflow: {workflow_file}")
+        logger.info("🔍 Analyzing CI/CD workflow: %s", workflow_file)
         
         workflow_path = self.project_path / workflow_file
         if not workflow_path.exists():
             return {"error": f"Workflow file not found: {workflow_file}"}
         
-        with open(workflow_path, 'r') as f:
-            content = f.read()
+        content = workflow_path.read_text(encoding='utf-8', errors='replace')
+        self.build_line_index(content)
+        self.prefetch_analysis_commands()
+        
+        self._warm_caches()
+        
+        # Analyze common CI/CD issues concurrently
+        analyzers = [
+            functools.partial(self.analyze_workflow_structure, content),
+            self.analyze_dependency_issues,
+            self.analyze_build_issues,
+            self.analyze_test_issues,
+            self.analyze_security_issues,
+            self.analyze_performance_issues,
+        ]
+        with ThreadPoolExecutor(max_workers=len(analyzers)) as executor:
+            futures = [executor.submit(analyzer) for analyzer in analyzers]
         
-        # Analyze common CI/CD issues
-        self.analyze_workflow_structure(content)
-        self.analyze_dependency_issues()
-        self.analyze_build_issues()
-        self.analyze_test_issues()
-        self.analyze_security_issues()
-        self.analyze_performance_issues()
+        # Analyzers only return their issues; record them here, in analyzer order
+        for future in futures:
+            self.analysis_report["issues"].extend(future.result())
         
         return self.analysis_report
     
+    def _warm_caches(self):
+        """Build the shared cached properties before the analyzers run concurrently"""
+        # cached_property has no lock, so concurrent first reads would each rebuild the value
+        for name in ('_pubspec_doc', '_project_files', '_dart_files', '_test_files', '_scan_cache'):
+            getattr(self, name)
+    
+    def prefetch_analysis_commands(self):
+        """Start the analyzers' independent flutter commands concurrently"""
+        commands = [TEST_COVERAGE_COMMAND, PUB_DEPS_COMMAND]
+        if self._pubspec_content is not None:
+            commands.append(PUB_OUTDATED_COMMAND)
+        
+        executor = ThreadPoolExecutor(max_workers=len(commands))
+        for command in commands:
+            self._command_futures[command] = executor.submit(
+                self.run_command, command, ANALYSIS_COMMAND_TIMEOUTS[command]
+            )
+        executor.shutdown(wait=False)
+    
+    def run_command(self, command, timeout: int) -> subprocess.CompletedProcess:
+        """Run a command in the project directory and capture its output"""
+        args = [self._flutter, *command[1:]] if command[0] == 'flutter' else list(command)
+        if command in EXIT_CODE_ONLY_COMMANDS:
+            return subprocess.run(
+                args,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=self.project_path,
+                timeout=timeout
+            )
+        return subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            cwd=self.project_path,
+            timeout=timeout
+        )
+    
+    def analysis_command_result(self, command) -> subprocess.CompletedProcess:
+        """Result of an analysis command, reusing a prefetched run if one exists"""
+        future = self._command_futures.pop(command, None)
+        if future is not None:
+            return future.result()
+        return self.run_command(command, ANALYSIS_COMMAND_TIMEOUTS[command])
+    
     def analyze_workflow_structure(self, content: str):
         """Analyze workflow structure for common issues"""
-        print("📋 Analyzing workflow structure...")
+        logger.info("📋 Analyzing workflow structure...")
         
         issues = []
         
@@ -93,23 +484,23 @@ class CICDAnalyzer:
                 "line": self.find_line_number(content, 'flutter build')
             })
         
-        self.analysis_report["issues"].extend(issues)
         return issues
     
     def analyze_dependency_issues(self):
         """Analyze dependency-related issues"""
-        print("📦 Analyzing dependency issues...")
+        logger.info("📦 Analyzing dependency issues...")
         
         issues = []
         
         # Check pubspec.yaml
-        pubspec_path = self.project_path / "pubspec.yaml"
-        if pubspec_path.exists():
-            with open(pubspec_path, 'r') as f:
-                content = f.read()
-            
+        content = self._pubspec_content
+        if content is not None:
             # Check for version constraints
-            if 'sdk:' not in content:
+            if self._pubspec_doc is not None:
+                has_sdk_constraint = 'sdk' in self._pubspec_section('environment')
+            else:
+                has_sdk_constraint = 'sdk:' in content
+            if not has_sdk_constraint:
                 issues.append({
                     "type": "sdk_constraint_missing",
                     "severity": "high",
@@ -120,15 +511,9 @@ class CICDAnalyzer:
             
             # Check for outdated dependencies
             try:
-                result = subprocess.run(
-                    ["flutter", "pub", "outdated"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_path,
-                    timeout=30
-                )
+                result = self.analysis_command_result(PUB_OUTDATED_COMMAND)
                 if result.returncode == 0:
-                    outdated_deps = result.stdout.count('outdated')
+                    outdated_deps = self.count_outdated_packages(json.loads(result.stdout))
                     if outdated_deps > 0:
                         issues.append({
                             "type": "outdated_dependencies",
@@ -146,23 +531,29 @@ class CICDAnalyzer:
                     "file": "pubspec.yaml"
                 })
         
-        self.analysis_report["issues"].extend(issues)
         return issues
     
+    def count_outdated_packages(self, outdated_report: Dict[str, Any]) -> int:
+        """Count packages with a newer upgradable version in `flutter pub outdated --json` output"""
+        count = 0
+        for package in outdated_report.get("packages", []):
+            current = (package.get("current") or {}).get("version")
+            upgradable = (package.get("upgradable") or {}).get("version")
+            if current is not None and upgradable is not None and current != upgradable:
+                count += 1
+        return count
+    
     def analyze_build_issues(self):
         """Analyze build-related issues"""
-        print("🔨 Analyzing build issues...")
+        logger.info("🔨 Analyzing build issues...")
         
         issues = []
         
         # Check for build configuration
-        pubspec_path = self.project_path / "pubspec.yaml"
-        if pubspec_path.exists():
-            with open(pubspec_path, 'r') as f:
-                content = f.read()
-            
+        content = self._pubspec_content
+        if content is not None:
             # Check for missing build configurations
-            if 'flutter_lints:' not in content:
+            if not self._pubspec_declares('flutter_lints'):
                 issues.append({
                     "type": "linting_missing",
                     "severity": "low",
@@ -172,7 +563,7 @@ class CICDAnalyzer:
                 })
             
             # Check for missing test dependencies
-            if 'flutter_test:' not in content:
+            if not self._pubspec_declares('flutter_test'):
                 issues.append({
                     "type": "test_dependencies_missing",
                     "severity": "medium",
@@ -182,7 +573,7 @@ class CICDAnalyzer:
                 })
             
             # Check for missing build_runner
-            if 'build_runner:' not in content and 'json_serializable:' in content:
+            if not self._pubspec_declares('build_runner') and self._pubspec_declares('json_serializable'):
                 issues.append({
                     "type": "build_runner_missing",
                     "severity": "medium",
@@ -191,17 +582,16 @@ class CICDAnalyzer:
                     "file": "pubspec.yaml"
                 })
         
-        self.analysis_report["issues"].extend(issues)
         return issues
     
     def analyze_test_issues(self):
         """Analyze test-related issues"""
-        print("🧪 Analyzing test issues...")
+        logger.info("🧪 Analyzing test issues...")
         
         issues = []
         
         # Check test directory structure
-        test_path = self.project_path / "test"
+        test_path = self.test_path
         if not test_path.exists():
             issues.append({
                 "type": "test_directory_missing",
@@ -212,7 +602,7 @@ class CICDAnalyzer:
             })
         else:
             # Check for test files
-            test_files = list(test_path.glob("**/*_test.dart"))
+            test_files = self._test_files
             if len(test_files) == 0:
                 issues.append({
                     "type": "no_test_files",
@@ -223,7 +613,7 @@ class CICDAnalyzer:
                 })
         
         # Check integration tests
-        integration_test_path = self.project_path / "integration_test"
+        integration_test_path = self.integration_test_path
         if not integration_test_path.exists():
             issues.append({
                 "type": "integration_test_missing",
@@ -235,13 +625,7 @@ class CICDAnalyzer:
         
         # Check test coverage
         try:
-            result = subprocess.run(
-                ["flutter", "test", "--coverage"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_path,
-                timeout=60
-            )
+            result = self.analysis_command_result(TEST_COVERAGE_COMMAND)
             if result.returncode != 0:
                 issues.append({
                     "type": "test_coverage_failed",
@@ -259,64 +643,37 @@ class CICDAnalyzer:
                 "file": "test/"
             })
         
-        self.analysis_report["issues"].extend(issues)
         return issues
     
     def analyze_security_issues(self):
         """Analyze security-related issues"""
-        print("🔒 Analyzing security issues...")
+        logger.info("🔒 Analyzing security issues...")
         
         issues = []
         
-        # Check for sensitive data in code
-        sensitive_patterns = [
-            r'password\s*=\s*[\'"]',
-            r'api[_-]*key\s*=\s*[\'"]',
-            r'secret\s*=\s*[\'"]',
-            'token\s*=\s*[\'"]',
-            'private[_-]*key\s*=\s*[\'"]'
-        ]
-        
-        for dart_file in self.project_path.glob("**/*.dart"):
-            try:
-                with open(dart_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    for pattern in sensitive_patterns:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            issues.append({
-                                "type": "sensitive_data_found",
-                                "severity": "high",
-                                "description": f"Sensitive data pattern found in {dart_file.name}",
-                                "fix": "Remove or secure sensitive data",
-                                "file": str(dart_file)
-                            })
-            except Exception as e:
-                print(f"Warning: Could not read {dart_file}: {e}")
+        # Check for sensitive data in code (file reads release the GIL); _warm_caches loaded _scan_cache
+        self._scan_results = {}
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for file_issues in executor.map(self.scan_sensitive_data, self._dart_files):
+                issues.extend(file_issues)
+        self.save_scan_cache()
         
         # Check for insecure dependencies
         try:
-            result = subprocess.run(
-                ["flutter", "pub", "deps"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_path,
-                timeout=30
-            )
+            result = self.analysis_command_result(PUB_DEPS_COMMAND)
             if result.returncode == 0:
-                # Check for known vulnerable packages
-                vulnerable_packages = [
-                    'http: ^0.13.5',  # Known vulnerabilities
-                    'path: ^1.8.3',  # Check for newer versions
-                ]
+                # Check for known vulnerable packages in a single scan
+                found = {match.group(0) for match in VULNERABLE_PACKAGE_RE.finditer(result.stdout)}
                 
-                for package in vulnerable_packages:
-                    if package in result.stdout:
+                for package in VULNERABLE_PACKAGES:
+                    if package in found:
                         issues.append({
                             "type": "vulnerable_dependency",
                             "severity": "high",
                             "description": f"Vulnerable dependency: {package}",
                             "fix": f"Update to a newer version of {package}",
-                            "file": "pubspec.yaml"
+                            "file": "pubspec.yaml",
+                            "package": package.partition(":")[0]
                         })
         except Exception as e:
             issues.append({
@@ -327,41 +684,98 @@ class CICDAnalyzer:
                 "file": "pubspec.yaml"
             })
         
-        self.analysis_report["issues"].extend(issues)
         return issues
     
+    def scan_sensitive_data(self, dart_file: Path) -> List[Dict[str, Any]]:
+        """Scan a single Dart file for sensitive data patterns"""
+        issues = []
+        
+        try:
+            # One issue per file is enough, so stop at the first match
+            if self.contains_sensitive_data(dart_file):
+                issues.append({
+                    "type": "sensitive_data_found",
+                    "severity": "high",
+                    "description": f"Sensitive data pattern found in {dart_file.name}",
+                    "fix": "Remove or secure sensitive data",
+                    "file": str(dart_file)
+                })
+        except Exception as e:
+            logger.warning("Could not read %s: %s", dart_file, e)
+        
+        return issues
+    
+    def contains_sensitive_data(self, dart_file: Path) -> bool:
+        """Check a Dart file for sensitive data, reusing cached results for unchanged files"""
+        key = dart_file.relative_to(self.project_path).as_posix()
+        stat = dart_file.stat()
+        fingerprint = [stat.st_size, stat.st_mtime_ns]
+        cached = self._scan_cache.get(key)
+        
+        if cached is not None and cached["stat"] == fingerprint:
+            entry = cached
+        else:
+            digest = file_sha256(dart_file)
+            if cached is not None and cached["sha256"] == digest:
+                entry = dict(cached, stat=fingerprint)
+            else:
+                entry = {
+                    "stat": fingerprint,
+                    "sha256": digest,
+                    "found": search_sensitive_data(dart_file)
+                }
+        
+        self._scan_results[key] = entry
+        return entry["found"]
+    
+    @functools.cached_property
+    def _scan_cache(self) -> Dict[str, Any]:
+        """Sensitive-data results from the previous run"""
+        cache_path = self.scan_cache_path
+        try:
+            cache = json.loads(cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        # Results from a different pattern set can't be reused
+        if not isinstance(cache, dict) or cache.get("pattern") != SENSITIVE_DATA_RE.pattern.decode():
+            return {}
+        return cache.get("files", {})
+    
+    def save_scan_cache(self):
+        """Persist this run's sensitive-data results for the next run"""
+        cache_path = self.scan_cache_path
+        cache = {"pattern": SENSITIVE_DATA_RE.pattern.decode(), "files": self._scan_results}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(cache), encoding='utf-8')
+        except OSError as e:
+            logger.warning("Could not save scan cache %s: %s", cache_path, e)
+    
     def analyze_performance_issues(self):
         """Analyze performance-related issues"""
-        print("⚡ Analyzing performance issues...")
+        logger.info("⚡ Analyzing performance issues...")
         
         issues = []
         
         # Check for performance bottlenecks in pubspec.yaml
-        pubspec_path = self.project_path / "pubspec.yaml"
-        if pubspec_path.exists():
-            with open(pubspec_path, 'r') as f:
-                content = f.read()
-            
-            # Check for heavy dependencies
-            heavy_packages = [
-                'firebase_core',
-                'google_maps_flutter',
-                'camera',
-                'video_player'
-            ]
-            
-            for package in heavy_packages:
-                    if package in content:
-                        issues.append({
-                            "type": "heavy_dependency",
-                            "lazy": "medium",
-                            "description": f"Heavy dependency: {package}",
-                            "fix": "Consider lazy loading or alternatives",
-                            "file": "pubspec.yaml"
-                        })
+        content = self._pubspec_content
+        if content is None:
+            return issues
+        
+        # Check for heavy dependencies
+        for package in HEAVY_PACKAGES:
+            if self._pubspec_declares(package):
+                issues.append({
+                    "type": "heavy_dependency",
+                    "severity": "medium",
+                    "description": f"Heavy dependency: {package}",
+                    "fix": "Consider lazy loading or alternatives",
+                    "file": "pubspec.yaml",
+                    "package": package
+                })
         
         # Check for missing performance optimizations
-        if 'cached_network_image:' not in content and 'http:' in content:
+        if not self._pubspec_declares('cached_network_image') and self._pubspec_declares('http'):
             issues.append({
                 "type": "image_caching_missing",
                 "severity": "medium",
@@ -370,31 +784,108 @@ class CICDAnalyzer:
                 "file": "pubspec.yaml"
             })
         
-        self.analysis_report["issues"].extend(issues)
         return issues
     
+    def build_line_index(self, content: str):
+        """Index newline offsets of content for line number lookups"""
+        self._line_index_content = content
+        self._line_offsets = [m.start() for m in re.finditer('\n', content)]
+    
     def find_line_number(self, content: str, pattern: str) -> Optional[int]:
         """Find line number of a pattern in content"""
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            if pattern in line:
-                return i
-        return None
+        index = content.find(pattern)
+        if index < 0:
+            return None
+        if content is not self._line_index_content:
+            self.build_line_index(content)
+        return bisect.bisect_left(self._line_offsets, index) + 1
     
     def apply_fixes(self) -> Dict[str, Any]:
         """Apply automated fixes for identified issues"""
-        print("🔧 Applying automated fixes...")
+        logger.info("🔧 Applying automated fixes...")
         
         fixes_applied = []
+        file_patches = defaultdict(list)
+        issues_by_type = defaultdict(list)
         
         for issue in self.analysis_report["issues"]:
-            fix_result = self.apply_fix_for_issue(issue)
-            if fix_result:
-                fixes_applied.append(fix_result)
+            if issue.get("type") in FILE_PATCH_FIXES:
+                file_patches[self.fix_target_path(issue)].append(issue)
+            else:
+                issues_by_type[issue.get("type")].append(issue)
+        
+        # Read and write each patched file once, however many fixes touch it
+        for path, issues in file_patches.items():
+            fixes_applied.extend(self.apply_file_fixes(path, issues))
+        
+        # Types with a batch fix handle all of their issues in one pass
+        for issue_type, issues in issues_by_type.items():
+            batch_fix = getattr(self, f"fix_{issue_type}_batch", None)
+            if batch_fix is not None:
+                fixes_applied.extend(batch_fix(issues))
+                continue
+            for issue in issues:
+                fix_result = self.apply_fix_for_issue(issue)
+                if fix_result:
+                    fixes_applied.append(fix_result)
         
         self.analysis_report["fixes_applied"] = fixes_applied
         return fixes_applied
     
+    def fix_target_path(self, issue: Dict[str, Any]) -> Path:
+        """File patched by a content fix for the given issue"""
+        default_file = FILE_PATCH_FIXES[issue["type"]][0]
+        return self.project_path / issue.get("file", default_file)
+    
+    def issue_package(self, issue: Dict[str, Any]) -> str:
+        """Package name recorded on the issue, else parsed from a 'Description: package' description"""
+        package = issue.get("package")
+        if package is not None:
+            return package
+        return issue.get("description", "").partition(":")[2].strip()
+    
+    def fix_message(self, issue: Dict[str, Any], outcome: int) -> str:
+        """Success (1) or failure (2) message for a content fix"""
+        return FILE_PATCH_FIXES[issue["type"]][outcome].format(package=self.issue_package(issue))
+    
+    def read_fix_target(self, path: Path) -> str:
+        """Read a file to patch, reusing the cached pubspec.yaml while it is unchanged"""
+        if (path == self.pubspec_path and '_pubspec_content' in self.__dict__
+                and self._pubspec_content is not None
+                and path.stat().st_mtime_ns == self._pubspec_mtime):
+            return self._pubspec_content
+        return path.read_text(encoding='utf-8')
+    
+    def write_fix_target(self, path: Path, content: str):
+        """Write a patched file, keeping the cached pubspec.yaml in sync"""
+        path.write_text(content, encoding='utf-8')
+        if path == self.pubspec_path:
+            self.__dict__['_pubspec_content'] = content
+            self.__dict__.pop('_pubspec_doc', None)
+            self._pubspec_mtime = path.stat().st_mtime_ns
+    
+    def apply_file_fixes(self, path: Path, issues: List[Dict[str, Any]]) -> List[str]:
+        """Apply content fixes to a file with a single read and write"""
+        try:
+            content = self.read_fix_target(path)
+        except Exception as e:
+            return [f"{self.fix_message(issue, 2)}: {str(e)}" for issue in issues]
+        
+        results = []
+        for issue in issues:
+            try:
+                content = getattr(self, f"patch_{issue['type']}")(content, issue)
+                results.append(self.fix_message(issue, 1))
+            except Exception as e:
+                results.append(f"{self.fix_message(issue, 2)}: {str(e)}")
+        
+        try:
+            self.write_fix_target(path, content)
+        except Exception as e:
+            return [f"{self.fix_message(issue, 2)}: {str(e)}" for issue in issues]
+        
+        return results
+    
     def apply_fix_for_issue(self, issue: Dict[str, Any]) -> Optional[str]:
         """Apply fix for a specific issue"""
         issue_type = issue.get("type")
@@ -436,220 +927,75 @@ class CICDAnalyzer:
     
     def fix_timeout_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing timeout in workflow"""
-        workflow_file = issue.get("file", ".github/workflows/ci.yml")
-        workflow_path = self.project_path / workflow_file
-        
-        try:
-            with open(workflow_path, 'r') as f:
-                content = f.read()
-            
-            # Add timeout to jobs
-            lines = content.split('\n')
-            modified_lines = []
-            
-            for line in lines:
-                if 'jobs:' in line or 'steps:' in line:
-                    modified_lines.append(line)
-                    modified_lines.append('    timeout-minutes: 30')
-                else:
-                    modified_lines.append(line)
-            
-            with open(workflow_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added timeout-minutes: 30 to jobs"
-            
-        except Exception as e:
-            return f"Failed to fix timeout: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
     
     def fix_cache_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing cache in workflow"""
-        workflow_file = issue.get("file", ".github/workflows/ci.yml")
-        workflow_path = self.project_path / workflow_file
-        
-        try:
-            with open(workflow_path, 'r') as f:
-                content = f.read()
-            
-            # Add Flutter caching
-            lines = content.split('\n')
-            modified_lines = []
-            
-            for line in lines:
-                if 'uses: subosito/flutter-action@v2' in line:
-                    modified_lines.append(line)
-                    modified_lines.append('        cache: true')
-                    modified_lines.append('        cache-key: flutter-${{ runner.os }}-${{ hashFiles(\'**/pubspec.lock\') }}')
-                    modified_lines.append('        cache-path: ${{ env.PUB_CACHE }}')
-                else:
-                    modified_lines.append(line)
-            
-            with open(workflow_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added Flutter caching to workflow"
-            
-        except Exception as e:
-            return f"Failed to add caching: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
     
     def fix_error_handling_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing error handling in workflow"""
-        workflow_file = issue.get("file", ".github/workflows/ci.yml")
-        workflow_path = self.project_path / workflow_file
-        
-        try:
-            with open(workflow_path, 'r') as f:
-                content = f.read()
-            
-            # Add proper error handling
-            lines = content.split('\n')
-            modified_lines = []
-            
-            for line in lines:
-                if 'steps:' in line:
-                    modified_lines.append(line)
-                    modified_lines.append('    continue-on-error: true')
-                else:
-                    modified_lines.append(line)
-            
-            with open(workflow_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added continue-on-error: true to steps"
-            
-        except Exception as e:
-            return f"Failed to add error handling: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
     
     def fix_artifact_upload_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing artifact upload in workflow"""
-        workflow_file = issue.get("file", ".github/workflows/ci.yml")
-        workflow_path = self.project_path / workflow_file
-        
-        try:
-            with open(workflow_path, 'r') as f:
-                content = f.read()
-            
-            # Add artifact upload after build
-            lines = content.split('\n')
-            modified_lines = []
-            
-            for line in lines:
-                if 'flutter build' in line:
-                    modified_lines.append(line)
-                    modified_lines.append('    - name: Upload build artifacts')
-                    modified_lines.append('      uses: actions/upload-artifact@v3')
-                    modified_lines.append('      with:')
-                    modified_lines.append('        name: build-artifacts')
-                    modified_lines.append('        path: build/')
-                    modified_lines.append('        retention-days: 30')
-                else:
-                    modified_lines.append(line)
-            
-            with open(workflow_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added artifact upload to workflow"
-            
-        except Exception as e:
-            return f"Failed to add artifact upload: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
     
     def fix_linting_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing linting in pubspec.yaml"""
-        pubspec_path = self.project_path / "pubspec.yaml"
-        
-        try:
-            with open(pubspec_path, 'r') as f:
-                content = f.read()
-            
-            # Add flutter_lints to dev_dependencies
-            lines = content.split('\n')
-            modified_lines = []
-            in_dev_dependencies = False
-            
-            for line in lines:
-                if 'dev_dependencies:' in line:
-                    in_dev_dependencies = True
-                    modified_lines.append(line)
-                    modified_lines.append('  flutter_lints: ^3.0.1')
-                elif in_dev_dependencies and 'flutter_lints:' not in line and '}' not in line:
-                    modified_lines.append(line)
-                else:
-                    modified_lines.append(line)
-            
-            with open(pubspec_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added flutter_lints to dev_dependencies"
-            
-        except Exception as e:
-            return f"Failed to add linting: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
     
     def fix_test_dependencies_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing test dependencies in pubspec.yaml"""
-        pubspec_path = self.project_path / "pubspec.yaml"
-        
-        try:
-            with open(pubspec_path, 'r') as f:
-                content = f.read()
-            
-            # Add flutter_test to dev_dependencies
-            lines = content.split('\n')
-            modified_lines = []
-            in_dev_dependencies = False
-            
-            for line in lines:
-                if 'dev_dependencies:' in line:
-                    in_dev_dependencies = True
-                    modified_lines.append(line)
-                    modified_lines.append('  flutter_test:')
-                    modified_lines.append('  sdk: flutter')
-                elif in_dev_dependencies and 'flutter_test:' not in line and '}' not in line:
-                    modified_lines.append(line)
-                else:
-                    modified_lines.append(line)
-            
-            with open(pubspec_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added flutter_test to dev_dependencies"
-            
-        except Exception as e:
-            return f"Failed to add test dependencies: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
     
     def fix_build_runner_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing build_runner in pubspec.yaml"""
-        pubspec_path = self.project_path / "pubspec.yaml"
-        
-        try:
-            with open(pubspec_path, 'r') as f:
-                content = f.read()
-            
-            # Add build_runner to dev_dependencies
-            lines = content.split('\n')
-            modified_lines = []
-            in_dev_dependencies = False
-            
-            for line in lines:
-                if 'dev_dependencies:' in line:
-                    in_dev_dependencies = True
-                    modified_lines.append(line)
-                    modified_lines('  build_runner: ^2.4.7')
-                elif in_dev_dependencies and 'build_runner:' not in line and '}' not in line:
-                    modified_lines.append(line)
-                else:
-                    modified_lines.append(line)
-            
-            with open(pubspec_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added build_runner to dev_dependencies"
-            
-        except Exception as e:
-            return f"Failed to add build_runner: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
+    
+    def patch_timeout_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add timeout to jobs"""
+        content = insert_after_matching_lines(content, 'jobs:', ['    timeout-minutes: 30'])
+        return insert_after_matching_lines(content, 'steps:', ['    timeout-minutes: 30'])
+    
+    def patch_cache_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add Flutter caching"""
+        return insert_after_matching_lines(content, 'uses: subosito/flutter-action@v2', [
+            '        cache: true',
+            '        cache-key: flutter-${{ runner.os }}-${{ hashFiles(\'**/pubspec.lock\') }}',
+            '        cache-path: ${{ env.PUB_CACHE }}',
+        ])
+    
+    def patch_error_handling_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add proper error handling"""
+        return insert_after_matching_lines(content, 'steps:', ['    continue-on-error: true'])
+    
+    def patch_artifact_upload_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add artifact upload after build"""
+        return insert_after_matching_lines(content, 'flutter build', [
+            '    - name: Upload build artifacts',
+            '      uses: actions/upload-artifact@v3',
+            '      with:',
+            '        name: build-artifacts',
+            '        path: build/',
+            '        retention-days: 30',
+        ])
+    
+    def patch_linting_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add flutter_lints to dev_dependencies"""
+        return insert_under_section(content, 'dev_dependencies', 'flutter_lints', ['  flutter_lints: ^3.0.1'])
+    
+    def patch_test_dependencies_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add flutter_test to dev_dependencies"""
+        return insert_under_section(content, 'dev_dependencies', 'flutter_test', ['  flutter_test:', '    sdk: flutter'])
+    
+    def patch_build_runner_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add build_runner to dev_dependencies"""
+        return insert_under_section(content, 'dev_dependencies', 'build_runner', ['  build_runner: ^2.4.7'])
     
     def fix_test_directory_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing test directory"""
-        test_path = self.project_path / "test"
+        test_path = self.test_path
         
         try:
             test_path.mkdir(exist_ok=True)
@@ -665,8 +1011,7 @@ void main() {
   });
 '''
             
-            with open(test_path / 'sample_test.dart', 'w') as f:
-                f.write(sample_test)
+            (test_path / 'sample_test.dart').write_text(sample_test, encoding='utf-8')
             
             return "Created test directory with sample test"
             
@@ -675,7 +1020,7 @@ void main() {
     
     def fix_no_test_files(self, issue: Dict[str, Any]) -> str:
         """Fix no test files"""
-        test_path = self.project_path / "test"
+        test_path = self.test_path
         
         try:
             # Create sample test files for common features
@@ -702,8 +1047,7 @@ void main() {
             ]
             
             for filename, content in test_files:
-                with open(test_path / filename, 'w') as f:
-                    f.write(content)
+                (test_path / filename).write_text(content, encoding='utf-8')
             
             return f"Created {len(test_files)} sample test files"
             
@@ -712,7 +1056,7 @@ void main() {
     
     def fix_integration_test_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing integration test directory"""
-        integration_test_path = self.project_path / "integration_test"
+        integration_test_path = self.integration_test_path
         
         try:
             integration_test_path.mkdir(exist_ok=True)
@@ -734,8 +1078,7 @@ void main() {
   }
 '''
             
-            with open(integration_test_path / 'app_test.dart', 'w') as f:
-                f.write(sample_integration_test)
+            (integration_test_path / 'app_test.dart').write_text(sample_integration_test, encoding='utf-8')
             
             return "Created integration_test directory with sample test"
             
@@ -744,36 +1087,17 @@ void main() {
     
     def fix_sdk_constraint_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing SDK constraint in pubspec.yaml"""
-        pubspec_path = self.project_path / "pubspec.yaml"
-        
-        try:
-            with open(pubspec_path, 'r') as f:
-                content = f.read()
-            
-            # Add SDK constraint
-            lines = content.split('\n')
-            modified_lines = []
-            
-            for line in lines:
-                if 'environment:' in line:
-                    modified_lines.append(line)
-                    modified_lines.append('  sdk: \'>=2.17.0 <4.0.0\'')
-                else:
-                    modified_lines.append(line)
-            
-            with open(pubspec_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added SDK constraint to pubspec.yaml"
-            
-        except Exception as e:
-            return f"Failed to add SDK constraint: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
+    
+    def patch_sdk_constraint_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add SDK constraint"""
+        return insert_after_matching_lines(content, 'environment:', ['  sdk: \'>=2.17.0 <4.0.0\''])
     
     def fix_outdated_dependencies(self, issue: Dict[str, Any]) -> str:
         """Fix outdated dependencies"""
         try:
             result = subprocess.run(
-                ["flutter", "pub", "upgrade"],
+                [self._flutter, "pub", "upgrade"],
                 capture_output=True,
                 text=True,
                 cwd=self.project_path,
@@ -788,25 +1112,54 @@ void main() {
         except Exception as e:
             return f"Failed to update dependencies: {str(e)}"
     
-    def fix_vulnerable_dependency(self, issue: Dict[str, Any]) -> str:
-        """Fix vulnerable dependency"""
-        package = issue.get("description", "").split(":")[1].strip()
+    def fix_vulnerable_dependency_batch(self, issues: List[Dict[str, Any]]) -> List[str]:
+        """Upgrade every vulnerable dependency with a single flutter pub upgrade"""
+        packages = list(dict.fromkeys(self.issue_package(issue) for issue in issues))
         
         try:
-            # Try to get the latest version
             result = subprocess.run(
-                ["flutter", "pub", "deps", package],
+                [self._flutter, "pub", "upgrade", "--major-versions", *packages],
                 capture_output=True,
                 text=True,
                 cwd=self.project_path,
-                timeout=30
+                timeout=120
             )
             
-            if result.returncode == 0:
-                # Parse the latest version
-                latest_version = self.parse_package_version(result.stdout)
-                if latest_version:
-                    return f"Updated {package} to {latest_version}"
+            if result.returncode != 0:
+                return [f"Failed to update {package}: {result.stderr}" for package in packages]
+            
+            # Versions resolved before the upgrade are stale now
+            self.__dict__.pop('_deps_tree', None)
+            return [self.fix_vulnerable_dependency({"package": package}) for package in packages]
+            
+        except Exception as e:
+            return [f"Failed to update {package}: {str(e)}" for package in packages]
+    
+    @functools.cached_property
+    def _deps_tree(self) -> Dict[str, str]:
+        """Resolved package versions from one `flutter pub deps --json` run"""
+        result = self.run_command(PUB_DEPS_JSON_COMMAND, ANALYSIS_COMMAND_TIMEOUTS[PUB_DEPS_JSON_COMMAND])
+        if result.returncode != 0:
+            return {}
+        try:
+            packages = json.loads(result.stdout).get("packages", [])
+        except (ValueError, AttributeError):
+            return {}
+        return {
+            entry["name"]: entry["version"]
+            for entry in packages
+            if isinstance(entry, dict) and "name" in entry and "version" in entry
+        }
+    
+    def fix_vulnerable_dependency(self, issue: Dict[str, Any]) -> str:
+        """Fix vulnerable dependency"""
+        package = self.issue_package(issue)
+        
+        try:
+            # Look the package up in the shared dependency tree
+            latest_version = self._deps_tree.get(package)
+            if latest_version:
+                return f"Updated {package} to {latest_version}"
             
             return f"Could not determine latest version for {package}"
             
@@ -817,104 +1170,36 @@ void main() {
         """Fix sensitive data in code"""
         file_path = issue.get("file", "")
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Remove sensitive data patterns
-            lines = content.split('\n')
-            modified_lines = []
-            
-            for line in lines:
-                # Replace sensitive patterns with placeholder
-                line = re.sub(r'(password\s*=\s*[\'"])(.*?)([\'"])', r'\1***\2***\3', line, flags=re.IGNORECASE)
-                line = re.sub(r'(api[_-]*key\s*=\s*[\'"])(.*?)([\'"])', r'\1***\2***\3', line, flags=re.IGNORECASE)
-                line = re.sub(r'(secret\s*=\s*[\'"])(.*?)([\'"])', r'\1***\2***\3', line, flags=re.IGNORECASE)
-                line = re.sub(r'(token\s*=\s*[\'"])(.*?)([\'"])', r'\1***\2***\3', line, flags=re.IGNORECASE)
-                line = re.sub(r'(private[_-]*key\s*=\s*[\'"])(.*?)([\'"])', r'\1***\2***\3', line, flags=re.IGNORECASE)
-                modified_lines.append(line)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return f"Removed sensitive data from {file_path}"
-            
-        except Exception as e:
-            return f"Failed to remove sensitive data from {file_path}: {str(e)}"
+        return fix_sensitive_file(file_path)
+    
+    def fix_sensitive_data_found_batch(self, issues: List[Dict[str, str]]) -> List[str]:
+        """Fix sensitive data in every flagged file"""
+        file_paths = [issue.get("file", "") for issue in issues]
+        
+        # Scrubbing is CPU-bound regex work, so spread files across processes
+        if len(file_paths) > 1:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(fix_sensitive_file, file_paths))
+        return [fix_sensitive_file(file_path) for file_path in file_paths]
     
     def fix_image_caching_missing(self, issue: Dict[str, Any]) -> str:
         """Fix missing image caching"""
-        pubspec_path = self.project_path / "pubspec.yaml"
-        
-        try:
-            with open(pubspec_path, 'r') as f:
-                content = f.read()
-            
-            # Add cached_network_image
-            lines = content.split('\n')
-            modified_lines = []
-            
-            in_dependencies = False
-            
-            for line in lines:
-                if 'dependencies:' in line:
-                    in_dependencies = True
-                elif in_dependencies and 'cached_network_image:' not in line and '}' not in line:
-                    modified_lines.append('  cached_network_image: ^3.3.0')
-                else:
-                    modified_lines.append(line)
-            
-            with open(pubspec_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return "Added cached_network_image to dependencies"
-            
-        except Exception as e:
-            return f"Failed to add image caching: {str(e)}"
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
     
-    def fix_heavy_dependency(self, issue: State) -> str:
+    def fix_heavy_dependency(self, issue: Dict[str, Any]) -> str:
         """Fix heavy dependency"""
-        package = issue.get("description", "").split(":")[1].strip()
-        
-        try:
-            # Add lazy loading recommendation
-            pubspec_path = self.project_path / "pubspec.yaml"
-            
-            with open(pubs_path, 'r') as f:
-                content = f.read()
-            
-            # Add comment about lazy loading
-            lines = content.split('\n')
-            modified_lines = []
-            
-            in_dependencies = False
-            
-            for line in lines:
-                if 'dependencies:' in line:
-                    in_dependencies = True
-                elif in_dependencies and package in line:
-                    modified_lines.append(line)
-                    modified_lines(f'    # Consider lazy loading {package} to improve startup performance')
-                else:
-                    modified_lines.append(line)
-            
-            with open(pubspec_path, 'w') as f:
-                f.write('\n'.join(modified_lines))
-            
-            return f"Added lazy loading recommendation for {package}"
-            
-        except Exception as e:
-            return f"Failed to add lazy loading recommendation for {package}: {str(e)}"
-    
-    def parse_package_version(self, output: str) -> Optional[str]:
-        """Parse package version from flutter pub deps output"""
-        lines = output.split('\n')
-        for line in lines:
-            if package in line and '├──' in line:
-                version_match = re.search(r'\^.*├──\s*([0-9.]+\.[0-9]+\.[0-9]+)', line)
-                if version_match:
-                    return version_match.group(1)
-        return None
+        return self.apply_file_fixes(self.fix_target_path(issue), [issue])[0]
+    
+    def patch_image_caching_missing(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add cached_network_image"""
+        return insert_under_section(content, 'dependencies', 'cached_network_image', ['  cached_network_image: ^3.3.0'])
+    
+    def patch_heavy_dependency(self, content: str, issue: Dict[str, Any]) -> str:
+        """Add comment about lazy loading"""
+        package = self.issue_package(issue)
+        return insert_after_section_entry(content, 'dependencies', package, [
+            f'    # Consider lazy loading {package} to improve startup performance'
+        ])
     
     def generate_report(self) -> str:
         """Generate comprehensive analysis report"""
@@ -931,23 +1216,21 @@ void main() {
         
         if self.analysis_report['issues']:
             report.append("## Issues Found")
-            for i, issue in enumerate(self.analysis_report['issues'], 1):
-                report.append(f"{i}. **{issue['severity'].upper()}** - {issue['description']}")
-                report.append(f"   Location: {issue.get('file', 'Unknown')}")
-                report.append(f"   Fix: {issue['fix']}")
-                report.append("")
+            report.extend(
+                ISSUE_TMPL.format(i=i, sev=issue['severity'].upper(), desc=issue['description'],
+                                  file=issue.get('file', 'Unknown'), fix=issue['fix'])
+                for i, issue in enumerate(self.analysis_report['issues'], 1)
+            )
         
         if self.analysis_report['fixes_applied']:
             report.append("## Fixes Applied")
-            for i, fix in enumerate(self.analysis_report['fixes_applied'], 1):
-                report.append(f"{i}. {fix}")
-                report.append("")
+            fixes = self.analysis_report['fixes_applied']
+            report.extend(map(LIST_ITEM_TMPL.format, range(1, len(fixes) + 1), fixes))
         
         if self.analysis_report['recommendations']:
             report.append("## Recommendations")
-            for i, rec in enumerate(self.analysis_report['recommendations'], 1):
-                report.append(f"{i}. {rec}")
-                report.append("")
+            recommendations = self.analysis_report['recommendations']
+            report.extend(map(LIST_ITEM_TMPL.format, range(1, len(recommendations) + 1), recommendations))
         
         return '\n'.join(report)
     
@@ -957,18 +1240,20 @@ void main() {
         
         try:
             report_content = self.generate_report()
-            with open(report_path, 'w') as f:
-                f.write(report_content)
+            # Encode once and write raw bytes, skipping the text layer's buffered encoder
+            report_path.write_bytes(report_content.encode('utf-8'))
             
-            print(f"📄 Analysis report saved to: {report_path}")
+            logger.info("📄 Analysis report saved to: %s", report_path)
             return str(report_path)
             
         except Exception as e:
-            print(f"❌ Failed to save report: {str(e)}")
+            logger.error("❌ Failed to save report: %s", e)
             return None
 
 def main():
     """Main function"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     print("🚀 CI/CD Pipeline Analyzer and Fixer")
     print("=" * 50)
     
@@ -36,6 +36,8 @@ from tkinter import ttk, scrolledtext, messagebox, filedialog, font
 import subprocess
 import threading
 import json
+import io
+import codecs
 import os
 import sys
 import time
@@ -44,7 +46,9 @@ import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 import queue
-from typing import Dict, List, Optional, Tuple, Any, Set
+import selectors
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Any, Set, ClassVar
 import psutil
 import platform
 from dataclasses import dataclass, asdict
@@ -59,6 +63,18 @@ from urllib.parse import urlparse
 import zipfile
 import tarfile
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Enhanced logging configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -70,6 +86,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Error markers appear near the start of a line; longer lines are only scanned up to here
+MAX_ERROR_SCAN_CHARS = 512
+
+# Start of well-known progress lines from successful runs; never scanned for errors
+BENIGN_PREFIXES = (
+    'Running Gradle task',
+    'Resolving dependencies',
+    'Got dependencies',
+    'Downloading packages',
+    'Launching lib/main.dart',
+    'Syncing files to device',
+    'Waiting for ',
+    'Running "flutter pub get"',
+)
+
+# Regex metacharacters; the text before the first one is a literal every match must contain
+REGEX_META_RE = re.compile(r'[\\.^$*+?()\[\]{}|]')
+
+# Last opened project, restored on startup
+LAST_PROJECT_FILE = Path('last_project.json')
+
+# Builds kept in EnhancedBuildManager.build_history; older records are dropped
+BUILD_HISTORY_LIMIT = 50
+
+# Bytes requested per read from a command's output pipe
+OUTPUT_READ_SIZE = 65536
+
+# Seconds a cancelled command gets to exit after SIGTERM before it is killed
+CANCEL_KILL_TIMEOUT = 5
+
+# Streamed console output: queue bound, chunks inserted per Tk tick, and tick interval in ms
+OUTPUT_QUEUE_SIZE = 10_000
+OUTPUT_DRAIN_BATCH = 500
+OUTPUT_DRAIN_INTERVAL = 50
+
+# Minimum seconds between forced console redraws while output streams in
+CONSOLE_FLUSH_INTERVAL = 0.1
+
+# Seconds a `flutter devices` listing is reused before querying again
+DEVICES_CACHE_TTL = 5.0
+
+# Device id (second "•" field) on a `flutter devices` line that mentions android
+ANDROID_DEVICE_RE = re.compile(r'^(?=.*android)[^•]*•\s*([^•]*?)\s*(?:•|$)', re.IGNORECASE)
+
+# Whole-word error keywords that map to improvement suggestions
+SUGGESTION_KEYWORD_RE = re.compile(r'\b(dependency|gradle|permission)\b', re.IGNORECASE)
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+def load_json_bytes(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # Create logs directory
 # Data classes and enums for enhanced build management
 @dataclass
@@ -206,14 +281,55 @@ class ResearchIntegration(Enum):
 class EnhancedBuildManager:
     """Enhanced Build Manager with AI insights, research integrations, and cross-platform support"""
 
+    # Enhanced error patterns with AI analysis
+    ERROR_PATTERNS: ClassVar[Dict[str, Tuple[re.Pattern, ...]]] = {
+        'compilation_error': (
+            re.compile(r'error:\s*(.+)', re.IGNORECASE),
+            re.compile(r'Error:\s*(.+)', re.IGNORECASE),
+            re.compile(r'ERROR:\s*(.+)', re.IGNORECASE),
+        ),
+        'dependency_error': (
+            re.compile(r'Could not resolve dependency', re.IGNORECASE),
+            re.compile(r'Package not found', re.IGNORECASE),
+            re.compile(r'pub get failed', re.IGNORECASE),
+        ),
+        'gradle_error': (
+            re.compile(r'Gradle task failed', re.IGNORECASE),
+            re.compile(r'Build failed with an exception', re.IGNORECASE),
+        ),
+        'flutter_error': (
+            re.compile(r'FlutterError', re.IGNORECASE),
+            re.compile(r'widget_test.dart.*failed', re.IGNORECASE),
+        ),
+        'permission_error': (
+            re.compile(r'Permission denied', re.IGNORECASE),
+            re.compile(r'access denied', re.IGNORECASE),
+        ),
+        'memory_error': (
+            re.compile(r'OutOfMemoryError', re.IGNORECASE),
+            re.compile(r'insufficient memory', re.IGNORECASE),
+        ),
+    }
+
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
         self.build_queue = queue.Queue()
         self.is_building = False
-        self.build_history: List[BuildRecord] = []
+        self.build_history: deque = deque(maxlen=BUILD_HISTORY_LIMIT)
         self.performance_metrics = BuildPerformanceMetrics()
         self.config_profiles: Dict[str, BuildProfile] = {}
 
+        # Set by the GUI to stream command output as it is read
+        self.output_queue: Optional[queue.Queue] = None
+
+        # Running command and the flag cancel() sets to stop its output pump
+        self._process: Optional[subprocess.Popen] = None
+        self._cancel_event = threading.Event()
+
+        # `flutter --version` output for the process lifetime, devices with a fetch time
+        self._flutter_version_cache: Optional[str] = None
+        self._devices_cache: Tuple[float, List[str]] = (0.0, [])
+
         # Detect Flutter path
         self.flutter_path = self._detect_flutter_path()
         logger.info(f"Flutter path: {self.flutter_path}")
@@ -224,36 +340,49 @@ class EnhancedBuildManager:
         self.ai_insights_engine = AIBuildInsightsEngine()
         self.research_integrations: Set[ResearchIntegration] = set()
 
-        # Enhanced error patterns with AI analysis
-        self.error_patterns = {
-            'compilation_error': [
-                re.compile(r'error:\s*(.+)', re.IGNORECASE),
-                re.compile(r'Error:\s*(.+)', re.IGNORECASE),
-                re.compile(r'ERROR:\s*(.+)', re.IGNORECASE),
-            ],
-            'dependency_error': [
-                re.compile(r'Could not resolve dependency', re.IGNORECASE),
-                re.compile(r'Package not found', re.IGNORECASE),
-                re.compile(r'pub get failed', re.IGNORECASE),
-            ],
-            'gradle_error': [
-                re.compile(r'Gradle task failed', re.IGNORECASE),
-                re.compile(r'Build failed with an exception', re.IGNORECASE),
-            ],
-            'flutter_error': [
-                re.compile(r'FlutterError', re.IGNORECASE),
-                re.compile(r'widget_test.dart.*failed', re.IGNORECASE),
-            ],
-            'permission_error': [
-                re.compile(r'Permission denied', re.IGNORECASE),
-                re.compile(r'access denied', re.IGNORECASE),
-            ],
-            'memory_error': [
-                re.compile(r'OutOfMemoryError', re.IGNORECASE),
-                re.compile(r'insufficient memory', re.IGNORECASE),
-            ],
+        # Enhanced error patterns with AI analysis (shared, never mutated)
+        self.error_patterns = self.ERROR_PATTERNS
+
+        # Flat (pattern, category id) pairs for code that needs every individual pattern
+        self._cat_names = tuple(self.error_patterns)
+        self._flat_pats = tuple(
+            (regex, category_id)
+            for category_id, regexes in enumerate(self.error_patterns.values())
+            for regex in regexes
+        )
+
+        # One alternation per category plus a combined pattern, so each line is scanned once
+        self._category_res = {
+            error_type: re.compile('|'.join(regex.pattern for regex in regexes), re.IGNORECASE)
+            for error_type, regexes in self.error_patterns.items()
+        }
+        self._combined_re = re.compile(
+            '|'.join(f'(?P<{error_type}>{regex.pattern})' for error_type, regex in self._category_res.items()),
+            re.IGNORECASE
+        )
+
+        # analyze_errors bucket for each category; gradle and memory errors fall through to other_errors
+        self._group_to_bucket = {
+            'compilation_error': 'compilation_errors',
+            'dependency_error': 'dependency_errors',
+            'flutter_error': 'flutter_errors',
+            'permission_error': 'permission_errors',
         }
 
+        # Literal prefilter: lowercase fragments every match contains, found in one pass per line
+        error_literals = [
+            (error_type, REGEX_META_RE.split(regex.pattern, 1)[0].lower())
+            for error_type, regexes in self.error_patterns.items()
+            for regex in regexes
+        ]
+        self._error_literals = tuple(dict.fromkeys(literal for _, literal in error_literals))
+        self._error_automaton = None
+        if HAS_AHOCORASICK and all(self._error_literals):
+            self._error_automaton = ahocorasick.Automaton()
+            for error_type, literal in error_literals:
+                self._error_automaton.add_word(literal, (error_type, literal))
+            self._error_automaton.make_automaton()
+
         # Success patterns
         self.success_patterns = [
             re.compile(r'Built build/.*\.apk', re.IGNORECASE),
@@ -441,19 +570,21 @@ class EnhancedBuildManager:
             if not main_dart.exists():
                 return False, "⚠️  main.dart not found in lib/"
 
-            # Validate Flutter SDK
-            try:
-                result = subprocess.run(
-                    ['flutter', '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=self.project_path
-                )
-                if result.returncode != 0:
-                    return False, f"❌ Flutter SDK not working: {result.stderr.strip()}"
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                return False, "❌ Flutter SDK not found or not accessible"
+            # Validate Flutter SDK (once per process)
+            if self._flutter_version_cache is None:
+                try:
+                    result = subprocess.run(
+                        ['flutter', '--version'],
+                        capture_output=True,
+                        text=True,
+                        timeout=10,
+                        cwd=self.project_path
+                    )
+                    if result.returncode != 0:
+                        return False, f"❌ Flutter SDK not working: {result.stderr.strip()}"
+                    self._flutter_version_cache = result.stdout
+                except (subprocess.TimeoutExpired, FileNotFoundError):
+                    return False, "❌ Flutter SDK not found or not accessible"
 
             # Research-backed checks
             issues = []
@@ -546,14 +677,19 @@ class EnhancedBuildManager:
 
     def _analyze_error_patterns(self, output: str) -> Dict[str, float]:
         """Analyze error patterns with confidence scores"""
-        patterns = {}
-        lines = output.split('\n')
-
-        for line in lines:
-            for error_type, regexes in self.error_patterns.items():
-                for regex in regexes:
-                    if regex.search(line):
-                        patterns[error_type] = patterns.get(error_type, 0) + 1
+        counts = [0] * len(self._cat_names)
+        flat_pats = self._flat_pats
+
+        for line in output.split('\n'):
+            for regex, category_id in flat_pats:
+                if regex.search(line):
+                    counts[category_id] += 1
+
+        patterns = {
+            error_type: count
+            for error_type, count in zip(self._cat_names, counts)
+            if count
+        }
 
         # Normalize to confidence scores
         total_matches = sum(patterns.values())
@@ -622,19 +758,21 @@ class EnhancedBuildManager:
             if not main_dart.exists():
                 return False, "⚠️  main.dart not found in lib/"
 
-            # Validate Flutter SDK
-            try:
-                result = subprocess.run(
-                    ['flutter', '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=self.project_path
-                )
-                if result.returncode != 0:
-                    return False, f"❌ Flutter SDK not working: {result.stderr.strip()}"
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                return False, "❌ Flutter SDK not found or not accessible"
+            # Validate Flutter SDK (once per process)
+            if self._flutter_version_cache is None:
+                try:
+                    result = subprocess.run(
+                        ['flutter', '--version'],
+                        capture_output=True,
+                        text=True,
+                        timeout=10,
+                        cwd=self.project_path
+                    )
+                    if result.returncode != 0:
+                        return False, f"❌ Flutter SDK not working: {result.stderr.strip()}"
+                    self._flutter_version_cache = result.stdout
+                except (subprocess.TimeoutExpired, FileNotFoundError):
+                    return False, "❌ Flutter SDK not found or not accessible"
 
             # Check for common issues
             issues = []
@@ -665,15 +803,17 @@ class EnhancedBuildManager:
             if not pubspec_path.exists():
                 return False, "pubspec.yaml not found - not a Flutter project"
             
-            # Check for Flutter SDK
-            result = subprocess.run(
-                ['flutter', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                return False, "Flutter SDK not found or not working"
+            # Check for Flutter SDK (once per process)
+            if self._flutter_version_cache is None:
+                result = subprocess.run(
+                    ['flutter', '--version'],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                if result.returncode != 0:
+                    return False, "Flutter SDK not found or not working"
+                self._flutter_version_cache = result.stdout
                 
             return True, "Flutter project validated successfully"
         except Exception as e:
@@ -721,8 +861,13 @@ class EnhancedBuildManager:
 
         return self.run_flutter_command(command, env=env)
 
-    def run_flutter_command(self, command: List[str], env: Optional[Dict[str, str]] = None) -> Tuple[bool, str]:
-        """Execute Flutter command with comprehensive logging and AI insights"""
+    def run_flutter_command(self, command: List[str], env: Optional[Dict[str, str]] = None,
+                            analyze: bool = True) -> Tuple[bool, str]:
+        """Execute Flutter command with comprehensive logging and AI insights
+
+        With analyze=False the output is not scanned for error patterns and
+        success depends on the exit code alone.
+        """
         try:
             logger.info(f"Executing Flutter command: {' '.join(command)}")
 
@@ -736,38 +881,95 @@ class EnhancedBuildManager:
                 research_integrations=list(self.research_integrations)
             )
 
+            # Pipes can only be multiplexed with selectors outside Windows; there stderr is merged
+            separate_stderr = os.name != 'nt'
+
             # Execute command
+            self._cancel_event.clear()
             process = subprocess.Popen(
                 command,
                 cwd=self.project_path,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+                stderr=subprocess.PIPE if separate_stderr else subprocess.STDOUT,
                 env=env
             )
-
-            output_lines = []
+            self._process = process
+
+            # Decode block reads ourselves, translating \r\n across chunk boundaries
+            streams = {process.stdout: 'stdout'}
+            if separate_stderr:
+                streams[process.stderr] = 'stderr'
+            decoders = {
+                name: io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder('utf-8')(errors='replace'), translate=True
+                )
+                for name in streams.values()
+            }
+            pending = dict.fromkeys(streams.values(), '')
+            output_buffer = io.StringIO()
             error_detected = False
             error_details = []
 
+            def consume(name: str, chunk: bytes):
+                nonlocal error_detected
+                text = decoders[name].decode(chunk, final=not chunk)
+                output_buffer.write(text)
+                if text and self.output_queue is not None:
+                    self.output_queue.put(text)
+
+                if not analyze:
+                    return
+                lines = (pending[name] + text).split('\n')
+                # Hold back a trailing partial line until the rest of it arrives
+                pending[name] = lines.pop() if chunk else ''
+
+                # stderr lines are reported as errors without pattern matching
+                if name == 'stderr':
+                    error_details.extend(line.strip() for line in lines if line.strip())
+                    return
+
+                # Detect errors in real-time
+                for line in lines:
+                    if line.startswith(BENIGN_PREFIXES):
+                        continue
+                    if self._match_error(line):
+                        error_detected = True
+                        error_details.append(line.strip())
+
             # Monitor performance
             start_time = time.time()
             initial_memory = psutil.virtual_memory().percent
             initial_cpu = psutil.cpu_percent(interval=None)
 
-            # Process output in real-time
-            for line in iter(process.stdout.readline, ''):
-                if line:
-                    output_lines.append(line.strip())
-
-                    # Detect errors in real-time
-                    if any(pattern in line for patterns in self.error_patterns.values() for pattern in patterns):
-                        error_detected = True
-                        error_details.append(line.strip())
-
-            process.wait()
+            # Process output in real-time, one thread for both streams
+            if separate_stderr:
+                with selectors.DefaultSelector() as selector:
+                    for stream, name in streams.items():
+                        selector.register(stream, selectors.EVENT_READ, name)
+                    # Wake periodically so a cancel is noticed even if a grandchild holds the pipes open
+                    while selector.get_map() and not self._cancel_event.is_set():
+                        for key, _ in selector.select(timeout=0.1):
+                            chunk = key.fileobj.read1(OUTPUT_READ_SIZE)
+                            consume(key.data, chunk)
+                            if not chunk:
+                                selector.unregister(key.fileobj)
+            else:
+                while not self._cancel_event.is_set():
+                    chunk = process.stdout.read1(OUTPUT_READ_SIZE)
+                    consume('stdout', chunk)
+                    if not chunk:
+                        break
+
+            if self._cancel_event.is_set():
+                # cancel() sent SIGTERM; don't hang on a child that ignores it
+                try:
+                    process.wait(timeout=CANCEL_KILL_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+            else:
+                process.wait()
+            self._process = None
 
             # Record performance metrics
             end_time = time.time()
@@ -776,7 +978,7 @@ class EnhancedBuildManager:
 
             build_record.end_time = datetime.now()
             build_record.success = process.returncode == 0 and not error_detected
-            build_record.output = '\n'.join(output_lines)
+            build_record.output = output_buffer.getvalue()
             build_record.errors = error_details
             build_record.duration = end_time - start_time
             build_record.memory_usage = final_memory
@@ -813,8 +1015,38 @@ class EnhancedBuildManager:
             logger.error(error_msg)
             return False, error_msg
 
-    def get_devices(self) -> List[str]:
-        """Get connected Android devices"""
+    def cancel(self):
+        """Stop the running command and its output pump"""
+        self._cancel_event.set()
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+    def get_dependencies(self) -> Tuple[bool, str]:
+        """Run flutter pub get; its output is only displayed"""
+        return self.run_flutter_command(['flutter', 'pub', 'get'], analyze=False)
+
+    def clean_project(self) -> Tuple[bool, str]:
+        """Run flutter clean; its output is only displayed"""
+        return self.run_flutter_command(['flutter', 'clean'], analyze=False)
+
+    def _match_error(self, line: str) -> Optional[re.Match]:
+        """Match a line against the error patterns, skipping the regex when no literal is present"""
+        probe = line[:MAX_ERROR_SCAN_CHARS]
+        lower = probe.lower()
+        if self._error_automaton is not None:
+            if next(self._error_automaton.iter(lower), None) is None:
+                return None
+        elif all(self._error_literals) and not any(literal in lower for literal in self._error_literals):
+            return None
+        return self._combined_re.search(probe)
+
+    def get_devices(self, force: bool = False) -> List[str]:
+        """Get connected Android devices, reusing a listing younger than DEVICES_CACHE_TTL"""
+        fetched_at, cached_devices = self._devices_cache
+        if not force and fetched_at and time.monotonic() - fetched_at < DEVICES_CACHE_TTL:
+            return cached_devices
+
         try:
             result = subprocess.run(
                 ['flutter', 'devices'],
@@ -825,10 +1057,11 @@ class EnhancedBuildManager:
             if result.returncode == 0:
                 # Parse device list
                 devices = []
-                for line in result.stdout.split('\n'):
-                    if '•' in line and 'android' in line.lower():
-                        device_id = line.split('•')[1].strip().split('•')[0].strip()
-                        devices.append(device_id)
+                for line in result.stdout.splitlines():
+                    match = ANDROID_DEVICE_RE.match(line)
+                    if match:
+                        devices.append(match.group(1))
+                self._devices_cache = (time.monotonic(), devices)
                 return devices
         except Exception as e:
             logger.error(f"Error getting devices: {e}")
@@ -845,27 +1078,22 @@ class EnhancedBuildManager:
             'other_errors': []
         }
         
-        lines = output.split('\n')
-        for line in lines:
-            for error_type, patterns in self.error_patterns.items():
-                for pattern in patterns:
-                    if pattern in line:
-                        if error_type == 'compilation_error':
-                            analysis['compilation_errors'].append(line.strip())
-                        elif error_type == 'dependency_error':
-                            analysis['dependency_errors'].append(line.strip())
-                        elif error_type == 'permission_error':
-                            analysis['permission_errors'].append(line.strip())
-                        elif error_type == 'flutter_error':
-                            analysis['flutter_errors'].append(line.strip())
-                        elif error_type == 'import_error':
-                            analysis['import_errors'].append(line.strip())
-        
-        # Categorize uncategorized errors
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['error', 'failed', 'exception']):
-                if not any(line.strip() in errors for errors in analysis.values() if errors):
-                    analysis['other_errors'].append(line.strip())
+        # Categorization depends only on a line's text, so other_errors just needs its own dedup
+        seen_other = set()
+        for line in output.split('\n'):
+            match = self._match_error(line)
+            bucket = self._group_to_bucket.get(match.lastgroup) if match else None
+            if bucket:
+                analysis[bucket].append(line.strip())
+                continue
+            
+            # Categorize uncategorized errors
+            lower = line.lower()
+            if 'error' in lower or 'failed' in lower or 'exception' in lower:
+                stripped = line.strip()
+                if stripped not in seen_other:
+                    analysis['other_errors'].append(stripped)
+                    seen_other.add(stripped)
         
         return analysis
 
@@ -873,18 +1101,20 @@ class EnhancedBuildManager:
 class ImprovementEngine:
     """Continuous improvement engine for build optimization"""
     
+    COMMON_FIXES: ClassVar[Dict[str, str]] = {
+        'dependency_conflict': 'flutter pub cache repair && flutter pub get',
+        'gradle_issues': 'cd android && ./gradlew clean && cd .. && flutter clean',
+        'flutter_doctor': 'flutter doctor -v',
+        'upgrade_flutter': 'flutter upgrade',
+        'clean_build': 'flutter clean && flutter pub get',
+    }
+    
     def __init__(self):
         self.suggestions = []
         self.performance_metrics = {}
-        self.common_fixes = {
-            'dependency_conflict': 'flutter pub cache repair && flutter pub get',
-            'gradle_issues': 'cd android && ./gradlew clean && cd .. && flutter clean',
-            'flutter_doctor': 'flutter doctor -v',
-            'upgrade_flutter': 'flutter upgrade',
-            'clean_build': 'flutter clean && flutter pub get',
-        }
+        self.common_fixes = self.COMMON_FIXES
     
-    def analyze_build_history(self, build_history: List[Dict]) -> List[str]:
+    def analyze_build_history(self, build_history: List[BuildRecord]) -> List[str]:
         """Analyze build history and provide improvement suggestions"""
         suggestions = []
         
@@ -892,8 +1122,8 @@ class ImprovementEngine:
             return ["No build history available. Run some builds first."]
         
         # Analyze failure patterns
-        recent_builds = build_history[-10:]  # Last 10 builds
-        failure_count = sum(1 for build in recent_builds if not build['success'])
+        recent_builds = list(build_history)[-10:]  # Last 10 builds
+        failure_count = sum(1 for build in recent_builds if not build.success)
         
         if failure_count > 5:
             suggestions.append("High failure rate detected. Consider running 'flutter doctor' to check environment.")
@@ -901,16 +1131,13 @@ class ImprovementEngine:
         # Check for common error patterns
         all_errors = []
         for build in recent_builds:
-            all_errors.extend(build.get('errors', []))
+            all_errors.extend(build.errors or [])
         
         error_types = set()
         for error in all_errors:
-            if 'dependency' in error.lower():
-                error_types.add('dependency')
-            elif 'gradle' in error.lower():
-                error_types.add('gradle')
-            elif 'permission' in error.lower():
-                error_types.add('permission')
+            match = SUGGESTION_KEYWORD_RE.search(error)
+            if match:
+                error_types.add(match.group(1).lower())
         
         if 'dependency' in error_types:
             suggestions.append("Dependency issues detected. Try: flutter pub cache repair")
@@ -1244,6 +1471,8 @@ class iSuiteMasterApp:
         self.improvement_engine = ImprovementEngine()
         self.plugin_manager = PluginManager()
         self.log_entries: List[LogEntry] = []
+        self.output_queue = queue.Queue(maxsize=OUTPUT_QUEUE_SIZE)
+        self._last_flush = 0.0
 
         # Setup enhanced UI
         self.setup_ui()
@@ -1447,6 +1676,7 @@ class iSuiteMasterApp:
         ttk.Button(run_frame, text="🧪 Run Tests", command=self.run_tests).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(run_frame, text="🔍 Analyze", command=self.analyze_project).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(run_frame, text="🧹 Clean", command=self.clean_project).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(run_frame, text="⏹️ Cancel", style='Error.TButton', command=self.cancel_command).pack(side=tk.LEFT, padx=(0, 10))
 
         # Maintenance operations
         maint_frame = ttk.LabelFrame(control_frame, text="Maintenance", padding="10")
@@ -1781,6 +2011,7 @@ class iSuiteMasterApp:
         
         def validate():
             self.build_manager = BuildManager(self.project_path)
+            self.build_manager.output_queue = self.output_queue
             success, message = self.build_manager.validate_flutter_project()
             
             self.root.after(0, lambda: self.validation_complete(success, message))
@@ -1862,7 +2093,7 @@ class iSuiteMasterApp:
         self.set_status("Refreshing devices...")
         
         def refresh():
-            devices = self.build_manager.get_devices()
+            devices = self.build_manager.get_devices(force=True)
             self.root.after(0, lambda: self.update_devices(devices))
         
         threading.Thread(target=refresh, daemon=True).start()
@@ -1887,10 +2118,55 @@ class iSuiteMasterApp:
         self.clear_console()
         
         def run():
-            success, output = command_func()
-            self.root.after(0, lambda: self.command_complete(success, output, description))
+            success, output = False, ""
+            try:
+                success, output = command_func()
+            except Exception as e:
+                output = f"Error: {str(e)}"
+            finally:
+                # Always queue completion (behind the streamed output) so the drain loop stops
+                self.output_queue.put(lambda: self.command_complete(success, output, description))
         
         threading.Thread(target=run, daemon=True).start()
+        self.root.after(OUTPUT_DRAIN_INTERVAL, self._drain_output)
+    
+    def cancel_command(self):
+        """Cancel the running Flutter command"""
+        if not self.build_manager:
+            return
+        
+        self.build_manager.cancel()
+        self.set_status("Cancelling...")
+        self.log_message("Cancel requested")
+    
+    def _drain_output(self):
+        """Insert queued command output in batches until the command completes"""
+        batch = []
+        on_complete = None
+        try:
+            while len(batch) < OUTPUT_DRAIN_BATCH:
+                item = self.output_queue.get_nowait()
+                if callable(item):
+                    on_complete = item
+                    break
+                batch.append(item)
+        except queue.Empty:
+            pass
+        
+        if batch:
+            self.console_text.insert(tk.END, "".join(batch))
+            if self.realtime_var.get():
+                self.console_text.see(tk.END)
+            # Redraw at most every CONSOLE_FLUSH_INTERVAL rather than once per insert
+            now = time.monotonic()
+            if now - self._last_flush > CONSOLE_FLUSH_INTERVAL:
+                self.root.update_idletasks()
+                self._last_flush = now
+        
+        if on_complete is not None:
+            on_complete()
+        else:
+            self.root.after(OUTPUT_DRAIN_INTERVAL, self._drain_output)
     
     def command_complete(self, success: bool, output: str, description: str):
         """Handle command completion"""
@@ -1940,7 +2216,6 @@ class iSuiteMasterApp:
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.console_output.insert(tk.END, f"[{timestamp}] {message}\n")
         self.console_output.see(tk.END)
-        self.root.update_idletasks()
     
     def set_status(self, message: str):
         """Set status bar message"""
@@ -1969,20 +2244,18 @@ class iSuiteMasterApp:
         """Save last project path"""
         if self.project_path:
             try:
-                with open('last_project.json', 'w') as f:
-                    json.dump({'project_path': str(self.project_path)}, f)
+                LAST_PROJECT_FILE.write_bytes(dump_json_bytes({'project_path': str(self.project_path)}))
             except Exception as e:
                 logger.error(f"Failed to save last project: {e}")
     
     def load_last_project(self):
         """Load last project path"""
         try:
-            if os.path.exists('last_project.json'):
-                with open('last_project.json', 'r') as f:
-                    data = json.load(f)
-                    self.project_path_var.set(data['project_path'])
-                    self.project_path = Path(data['project_path'])
-                    self.log_message(f"Loaded last project: {data['project_path']}")
+            if LAST_PROJECT_FILE.exists():
+                data = load_json_bytes(LAST_PROJECT_FILE.read_bytes())
+                self.project_path_var.set(data['project_path'])
+                self.project_path = Path(data['project_path'])
+                self.log_message(f"Loaded last project: {data['project_path']}")
         except Exception as e:
             logger.error(f"Failed to load last project: {e}")
 
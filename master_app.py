@@ -8,22 +8,152 @@ with advanced logging, error analysis, and continuous improvement features.
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import subprocess
+import asyncio
 import threading
 import queue
 import json
 import os
 import sys
 import time
-from datetime import datetime
 from pathlib import Path
 import re
+import signal
 import logging
+import logging.handlers
 import platform
+from collections import deque
+from functools import lru_cache
 import shutil
-from typing import Dict, List, Optional, Tuple
+import glob
+from typing import ClassVar, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+# Optional YAML parser for pubspec.yaml (falls back to a regex scan)
+try:
+    import yaml
+    HAS_YAML = True
+    YAML_LOADER = getattr(yaml, 'CSafeLoader', None) or yaml.SafeLoader
+except ImportError:
+    HAS_YAML = False
+
+# Optional system memory probe for sizing concurrent Flutter processes
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+# Buffered log records flushed to the log file in one write
+LOG_BUFFER_CAPACITY = 200
+
+# Log line layout shared by console and file output
+LOG_FORMAT = '[%(asctime)s] - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Number of trailing output lines kept from a Flutter command
+OUTPUT_TAIL_LINES = 4096
+
+# Longest single output line the subprocess stream reader accepts
+STREAM_LINE_LIMIT = 1024 * 1024
+
+# Start of the top-level dependencies section and of any top-level key
+DEPENDENCIES_SECTION_RE = re.compile(r'^dependencies:', re.M)
+TOP_LEVEL_KEY_RE = re.compile(r'^[^\s#]', re.M)
+
+# Package entry directly under a section
+DEPENDENCY_ENTRY_RE = re.compile(r'^  ([A-Za-z_]\w*)\s*:', re.M)
+
+# Paths already seen to exist; misses are never cached so a later-created path is found
+_existing_paths: Set[str] = set()
+
+def _path_exists_cached(path: str) -> bool:
+    """Return whether a path exists, skipping the stat once it has been found"""
+    if path in _existing_paths:
+        return True
+    if os.path.exists(path):
+        _existing_paths.add(path)
+        return True
+    return False
+
+@lru_cache(maxsize=8)
+def _read_pubspec_cached(path: str, mtime: float) -> str:
+    """Read pubspec.yaml, re-reading only when its mtime changes"""
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+# Attempts and back-off for deletions blocked by scanners on Windows
+RMTREE_RETRIES = 3
+RMTREE_RETRY_DELAY = 0.1
+
+def _retry_on_windows(func, path: str) -> None:
+    """Call func(path), retrying briefly on Windows sharing violations"""
+    attempts = RMTREE_RETRIES if os.name == 'nt' else 1
+    for attempt in range(attempts):
+        try:
+            return func(path)
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(RMTREE_RETRY_DELAY)
+
+def _fast_rmtree(path: str) -> None:
+    """Remove a directory tree using scandir entry types instead of per-entry stats"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if getattr(entry, 'is_junction', lambda: False)():
+                # Remove Windows junctions themselves, never their targets
+                _retry_on_windows(os.rmdir, entry.path)
+            elif entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                _retry_on_windows(os.unlink, entry.path)
+    _retry_on_windows(os.rmdir, path)
+
+# Suffix for build directories renamed aside for background deletion
+BUILD_TRASH_SUFFIX = ".trash."
+
+def _delete_trees_in_background(paths: List[str]) -> None:
+    """Delete directory trees on a daemon thread"""
+    def worker():
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+    threading.Thread(target=worker, name="build-trash-cleaner", daemon=True).start()
+
+# Start each Flutter process in its own process group so wrappers (flutter.bat, shell scripts)
+# and everything they spawn can be killed together
+PROCESS_GROUP_KWARGS = (
+    {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == 'nt'
+    else {'start_new_session': True}
+)
+
+def _kill_process_tree(pid: int) -> None:
+    """Kill a process started with PROCESS_GROUP_KWARGS together with its descendants"""
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/T', '/F', '/PID', str(pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+# Seconds to wait for a killed process tree to exit and release its pipes
+PROCESS_KILL_WAIT = 5
+
+# How long a cached `flutter pub outdated` result stays valid (seconds)
+OUTDATED_CACHE_TTL = 3600
+
+def _max_concurrent_processes(memory_limit_mb: int) -> int:
+    """Number of Flutter processes that fit in available RAM at memory_limit_mb each"""
+    if HAS_PSUTIL:
+        available = psutil.virtual_memory().available
+    elif hasattr(os, 'sysconf') and 'SC_AVPHYS_PAGES' in os.sysconf_names:
+        available = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    else:
+        return 1
+    return max(1, available // (memory_limit_mb * 1024 * 1024))
+
 # Configuration
 @dataclass
 class AppConfig:
@@ -56,6 +186,93 @@ class AppConfig:
     # Flutter configuration
     flutter_channel: str = "stable"
     flutter_version: str = "3.41.2"
+    
+    def __post_init__(self):
+        """Resolve Flutter from PATH instead of going through a batch-file shim"""
+        if self.flutter_path.lower().endswith('.bat') or not os.path.exists(self.flutter_path):
+            self.flutter_path = shutil.which('flutter.exe') or shutil.which('flutter') or self.flutter_path
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats the timestamp once per second"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ts_cache = (None, "")
+        
+    def formatTime(self, record, datefmt=None):
+        """Format record time, reusing the string for records in the same second"""
+        sec = int(record.created)
+        if sec != self._ts_cache[0]:
+            ct = self.converter(sec)
+            self._ts_cache = (sec, time.strftime(datefmt or self.default_time_format, ct))
+        if datefmt or not self.default_msec_format:
+            return self._ts_cache[1]
+        return self.default_msec_format % (self._ts_cache[1], record.msecs)
+
+class SharedAppendFileHandler(logging.FileHandler):
+    """FileHandler whose log file can be appended to by several processes at once"""
+    
+    def _open(self):
+        """Open the log file for atomic appends, shared with other writers"""
+        if os.name != 'nt':
+            # Mode 'a' opens with O_APPEND, so each record's write lands whole at the end
+            return super()._open()
+        
+        import ctypes
+        import msvcrt
+        from ctypes import wintypes
+        
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        kernel32.CreateFileW.argtypes = [
+            wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+            wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE
+        ]
+        
+        # FILE_APPEND_DATA without FILE_WRITE_DATA makes every write an atomic append
+        file_append_data = 0x0004
+        share_read_write_delete = 0x0001 | 0x0002 | 0x0004
+        open_always = 4
+        file_attribute_normal = 0x80
+        
+        handle = kernel32.CreateFileW(
+            self.baseFilename, file_append_data, share_read_write_delete,
+            None, open_always, file_attribute_normal, None
+        )
+        if handle is None or handle == wintypes.HANDLE(-1).value:
+            raise ctypes.WinError(ctypes.get_last_error())
+        fd = msvcrt.open_osfhandle(handle, os.O_APPEND)
+        return open(fd, self.mode, encoding=self.encoding, errors=self.errors)
+
+class BatchedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that hands its whole buffer to the target file in one write"""
+    
+    def flush(self):
+        """Format the buffered records and append them with a single write() call"""
+        self.acquire()
+        try:
+            target = self.target
+            if target is None:
+                return
+            try:
+                records = [record for record in self.buffer if target.filter(record)]
+                if not records:
+                    return
+                target.acquire()
+                try:
+                    if target.stream is None:
+                        target.stream = target._open()
+                    # One joined string per flush keeps a batch together under O_APPEND
+                    target.stream.write(''.join(target.format(record) + target.terminator for record in records))
+                    target.stream.flush()
+                except Exception:
+                    target.handleError(records[-1])
+                finally:
+                    target.release()
+            finally:
+                self.buffer.clear()
+        finally:
+            self.release()
 
 class LogLevel(Enum):
     DEBUG = "DEBUG"
@@ -80,10 +297,55 @@ class Platform(Enum):
 class MasterApp:
     """Main application class for iSuite Flutter project management"""
     
+    # (flutter_path, project_path) pairs already validated in this process
+    _validated_environments: ClassVar[Set[Tuple[str, str]]] = set()
+    
     def __init__(self, config: Optional[AppConfig] = None):
         self.config = config or AppConfig()
+        
+        # Menu choice -> (handler, args)
+        self._menu = {
+            "1": (self.build_project, (BuildType.DEBUG,)),
+            "2": (self.clean_project, ()),
+            "3": (self.run_project, (BuildType.DEBUG,)),
+            "4": (self.run_tests, ()),
+            "5": (self.analyze_code, ()),
+            "6": (self.format_code, ()),
+            "7": (self.upgrade_dependencies, ()),
+            "8": (self.check_dependencies, ()),
+            "9": (self.show_project_info, ()),
+            "10": (self.show_git_menu, ()),
+            "11": (self.show_settings_menu, ()),
+            "12": (self.exit_app, ()),
+        }
+        self._settings_menu = {
+            "1": self._set_target_platform,
+            "2": self._set_build_type,
+            "3": self._set_log_level,
+            "4": self._toggle_log_to_file,
+            "5": self._toggle_log_to_console,
+            "6": self._set_max_build_time,
+            "7": self._set_max_run_time,
+            "8": self._set_memory_limit,
+        }
+        
+        # Environment shared by every Flutter subprocess
+        self._subproc_env = {**os.environ, 'FLUTTER_ROOT': os.path.dirname(self.config.flutter_path)}
+        
+        # Bound concurrent Flutter processes so parallel builds don't exhaust RAM
+        self._proc_sem = threading.BoundedSemaphore(_max_concurrent_processes(self.config.memory_limit_mb))
+        
+        # (pubspec mtime, dependency names) from the last parse
+        self._pubspec_deps_cache: Tuple[float, List[str]] = (0.0, [])
         self.setup_logging()
-        self.validate_environment()
+        
+        # Environment is validated lazily before the first command runs
+        self._validated = False
+        
+        # Finish deleting build directories left over from earlier cleans
+        leftovers = glob.glob(glob.escape(self.config.build_path) + BUILD_TRASH_SUFFIX + "*")
+        if leftovers:
+            _delete_trees_in_background(leftovers)
         
     def setup_logging(self):
         """Setup logging configuration"""
@@ -92,14 +354,29 @@ class MasterApp:
         os.makedirs(log_dir, exist_ok=True)
         
         # Configure logging
-        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        formatter = CachedTimeFormatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+        self._console_handler = logging.StreamHandler(sys.stdout)
+        self._console_handler.setFormatter(formatter)
+        
+        # Buffer records in memory and append each batch with one write (or sooner on errors)
+        file_handler = SharedAppendFileHandler(self.config.log_file_path, encoding='utf-8', delay=True)
+        file_handler.setFormatter(formatter)
+        self._file_handler = BatchedMemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        
+        # Only attach the outputs that are enabled; the settings menu toggles them later
+        handlers = []
+        if self.config.log_to_console:
+            handlers.append(self._console_handler)
+        if self.config.log_to_file:
+            handlers.append(self._file_handler)
+        
         logging.basicConfig(
             level=getattr(logging, self.config.log_level.upper()),
-            format=log_format,
-            handlers=[
-                logging.FileHandler(self.config.log_file_path),
-                logging.StreamHandler(sys.stdout)
-            ]
+            handlers=handlers
         )
         
         self.logger = logging.getLogger(__name__)
@@ -107,10 +384,14 @@ class MasterApp:
         
     def validate_environment(self):
         """Validate the development environment"""
+        key = (self.config.flutter_path, self.config.project_path)
+        if key in MasterApp._validated_environments:
+            return
+        
         self.log("Validating environment...", LogLevel.INFO)
         
         # Check Flutter installation
-        if not os.path.exists(self.config.flutter_path):
+        if not _path_exists_cached(self.config.flutter_path):
             self.log(f"Flutter not found at: {self.config.flutter_path}", LogLevel.ERROR)
             raise FileNotFoundError(f"Flutter SDK not found at {self.config.flutter_path}")
         
@@ -122,92 +403,162 @@ class MasterApp:
         ]
         
         for path in required_paths:
-            if not os.path.exists(path):
+            if not _path_exists_cached(path):
                 self.log(f"Required path not found: {path}", LogLevel.ERROR)
                 raise FileNotFoundError(f"Required path not found: {path}")
         
+        MasterApp._validated_environments.add(key)
         self.log("Environment validation completed", LogLevel.INFO)
         
+    def _ensure_validated(self):
+        """Validate the environment once, on first use"""
+        if not self._validated:
+            self.validate_environment()
+            self._validated = True
+        
     def log(self, message: str, level: LogLevel = LogLevel.INFO):
         """Log a message with timestamp"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_message = f"[{timestamp}] - {level.value} - {message}"
-        
-        if self.config.log_to_file:
-            with open(self.config.log_file_path, 'a', encoding='utf-8') as f:
-                f.write(log_message + '\n')
-        
-        if self.config.log_to_console:
-            print(log_message)
+        self.logger.log(getattr(logging, level.value), message)
             
     def run_flutter_command(self, command: List[str], cwd: Optional[str] = None, timeout: int = 60) -> Tuple[bool, str]:
         """Run a Flutter command with error handling and logging"""
+        return asyncio.run(self.run_flutter_command_async(command, cwd=cwd, timeout=timeout))
+        
+    async def run_flutter_command_async(self, command: List[str], cwd: Optional[str] = None, timeout: int = 60) -> Tuple[bool, str]:
+        """Run a Flutter command asynchronously with error handling and logging"""
+        await asyncio.to_thread(self._proc_sem.acquire)
         try:
-            self.log(f"Running Flutter command: {' '.join(command)}", LogLevel.INFO)
+            return await self._run_flutter_process(command, cwd, timeout)
+        finally:
+            self._proc_sem.release()
             
-            # Set environment variables
-            env = os.environ.copy()
-            env['FLUTTER_ROOT'] = os.path.dirname(self.config.flutter_path)
+    async def _run_flutter_process(self, command: List[str], cwd: Optional[str], timeout: int) -> Tuple[bool, str]:
+        """Spawn a Flutter process, stream its output and collect the result"""
+        cmd_str = ' '.join(command)
+        try:
+            self._ensure_validated()
+            self.log(f"Running Flutter command: {cmd_str}", LogLevel.INFO)
             
             # Run the command
-            process = subprocess.Popen(
-                command,
+            process = await asyncio.create_subprocess_exec(
+                self.config.flutter_path,
+                *command,
                 cwd=cwd or self.config.project_path,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                env=env
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._subproc_env,
+                limit=STREAM_LINE_LIMIT,
+                **PROCESS_GROUP_KWARGS
             )
+            finished = False
+            
+            # Stream output as it arrives, keeping only the tail in memory
+            stdout_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+            stderr_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+            
+            async def read_stdout():
+                async for raw in process.stdout:
+                    line = raw.decode('utf-8', errors='replace').rstrip()
+                    stdout_tail.append(line)
+                    self.log(line, LogLevel.INFO)
+                    
+            async def read_stderr():
+                async for raw in process.stderr:
+                    stderr_tail.append(raw.decode('utf-8', errors='replace').rstrip())
             
             # Wait for completion with timeout
             try:
-                stdout, stderr = process.communicate(timeout=timeout)
+                await asyncio.wait_for(asyncio.gather(read_stdout(), read_stderr(), process.wait()), timeout)
+                finished = True
+                stdout = '\n'.join(stdout_tail)
+                stderr = '\n'.join(stderr_tail)
                 return_code = process.returncode
                 
                 if return_code == 0:
-                    self.log(f"Command completed successfully: {' '.join(command)}", LogLevel.INFO)
+                    self.log(f"Command completed successfully: {cmd_str}", LogLevel.INFO)
                     return True, stdout
                 else:
                     error_msg = stderr.strip() if stderr else f"Command failed with return code {return_code}"
                     self.log(error_msg, LogLevel.ERROR)
                     return False, error_msg
                     
-            except subprocess.TimeoutExpired:
-                error_msg = f"Command timed out after {timeout} seconds: {' '.join(command)}"
+            except asyncio.TimeoutError:
+                error_msg = f"Command timed out after {timeout} seconds: {cmd_str}"
                 self.log(error_msg, LogLevel.ERROR)
                 return False, error_msg
+            finally:
+                # On timeout, an over-long line or cancellation, kill the whole group: a grandchild
+                # still holding the pipes would otherwise keep process.wait() from returning
+                if not finished:
+                    _kill_process_tree(process.pid)
+                    try:
+                        await asyncio.wait_for(process.wait(), PROCESS_KILL_WAIT)
+                    except asyncio.TimeoutError:
+                        # Something outside the group (e.g. a daemonised helper) kept the pipes open
+                        self.log(f"Gave up waiting for killed command to exit: {cmd_str}", LogLevel.WARNING)
+                        process._transport.close()
                 
         except Exception as e:
-            error_msg = f"Exception running command: {str(e)} - {' '.join(command)}"
+            error_msg = f"Exception running command: {str(e)} - {cmd_str}"
             self.log(error_msg, LogLevel.ERROR)
             return False, error_msg
             
+    def run_command(self, command: List[str], timeout: int = 60) -> Tuple[bool, str]:
+        """Run a non-Flutter command (e.g. git) in the project directory"""
+        try:
+            result = subprocess.run(
+                command,
+                cwd=self.config.project_path,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            if result.returncode == 0:
+                return True, result.stdout
+            return False, result.stderr.strip() or f"Command failed with return code {result.returncode}"
+        except subprocess.TimeoutExpired:
+            return False, f"Command timed out after {timeout} seconds: {' '.join(command)}"
+        except Exception as e:
+            return False, f"Exception running command: {str(e)} - {' '.join(command)}"
+            
     def clean_project(self) -> bool:
         """Clean the project by removing build artifacts"""
         self.log("Cleaning project...", LogLevel.INFO)
         
         try:
+            # Validate before build/ (a required path) is removed
+            self._ensure_validated()
+            
             # Remove build directory
             if os.path.exists(self.config.build_path):
-                shutil.rmtree(self.config.build_path)
+                trash = f"{self.config.build_path}{BUILD_TRASH_SUFFIX}{os.getpid()}.{time.time_ns()}"
+                try:
+                    # Rename is one syscall; the actual deletion happens off the menu thread
+                    os.rename(self.config.build_path, trash)
+                    _delete_trees_in_background([trash])
+                except OSError:
+                    _fast_rmtree(self.config.build_path)
+                _existing_paths.discard(self.config.build_path)
                 self.log("Removed build directory", LogLevel.INFO)
             
-            # Clean Flutter cache
-            cache_clean_result = self.run_flutter_command(["clean"], timeout=30)
-            if not cache_clean_result[0]:
-                self.log("Flutter cache cleaned", LogLevel.INFO)
-            
-            # Get dependencies
-            deps_result = self.run_flutter_command(["pub", "get"], timeout=120)
-            if not deps_result[0]:
-                self.log("Dependencies updated", LogLevel.INFO)
-                
+            asyncio.run(self._clean_and_get_dependencies())
             return True
             
         except Exception as e:
             self.log(f"Clean failed: {str(e)}", LogLevel.ERROR)
             return False
             
+    async def _clean_and_get_dependencies(self) -> None:
+        """Run flutter clean and pub get in one event loop"""
+        # pub get must follow clean: clean deletes .dart_tool, which pub get regenerates
+        cache_clean_result = await self.run_flutter_command_async(["clean"], timeout=30)
+        if cache_clean_result[0]:
+            self.log("Flutter cache cleaned", LogLevel.INFO)
+        
+        deps_result = await self.run_flutter_command_async(["pub", "get"], timeout=120)
+        if deps_result[0]:
+            self.log("Dependencies updated", LogLevel.INFO)
+            
     def build_project(self, build_type: BuildType = BuildType.DEBUG) -> bool:
         """Build the Flutter project"""
         self.log(f"Building project in {build_type.value} mode...", LogLevel.INFO)
@@ -337,9 +688,31 @@ class MasterApp:
         self.log("Checking dependencies...", LogLevel.INFO)
         
         try:
+            cache_path = os.path.join(os.path.dirname(self.config.log_file_path), "outdated.cache.json")
+            lock_path = os.path.join(self.config.project_path, "pubspec.lock")
+            mtimes = [
+                os.path.getmtime(path) if os.path.exists(path) else None
+                for path in (self.config.pubspec_path, lock_path)
+            ]
+            
+            # Reuse the last result while pubspec.yaml/pubspec.lock are unchanged
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get('mtimes') == mtimes and time.time() - cached.get('ts', 0) < OUTDATED_CACHE_TTL:
+                    self.log(f"Using cached dependency check:\n{cached['stdout']}", LogLevel.INFO)
+                    return True
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+            
             check_result = self.run_flutter_command(["pub", "outdated"], timeout=60)
             
             if check_result[0]:
+                try:
+                    with open(cache_path, 'w', encoding='utf-8') as f:
+                        json.dump({'mtimes': mtimes, 'stdout': check_result[1], 'ts': time.time()}, f)
+                except OSError as e:
+                    self.log(f"Could not cache dependency check: {str(e)}", LogLevel.WARNING)
                 self.log("Dependencies check completed", LogLevel.INFO)
                 return True
             else:
@@ -371,10 +744,12 @@ class MasterApp:
             
             # Check if pubspec exists and get dependencies
             if os.path.exists(self.config.pubspec_path):
-                with open(self.config.pubspec_path, 'r') as f:
-                    pubspec_content = f.read()
-                    info["dependencies"] = pubspec_content
-                    info["flutter_dependencies"] = self._extract_flutter_dependencies(pubspec_content)
+                mtime = os.path.getmtime(self.config.pubspec_path)
+                pubspec_content = _read_pubspec_cached(self.config.pubspec_path, mtime)
+                info["dependencies"] = pubspec_content
+                if self._pubspec_deps_cache[0] != mtime:
+                    self._pubspec_deps_cache = (mtime, self._extract_flutter_dependencies(pubspec_content))
+                info["flutter_dependencies"] = self._pubspec_deps_cache[1]
             
             return info
             
@@ -384,24 +759,19 @@ class MasterApp:
             
     def _extract_flutter_dependencies(self, pubspec_content: str) -> List[str]:
         """Extract Flutter dependencies from pubspec.yaml"""
-        dependencies = []
-        lines = pubspec_content.split('\n')
-        in_deps = False
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('dependencies:'):
-                in_deps = True
-            elif in_deps and line.startswith('-') and ':' in line:
-                dep = line.split(':')[1].strip()
-                dep = dep.split(' ')[0].strip()
-                dependencies.append(dep)
-            elif in_deps and not line.startswith('#') and line.strip():
-                dep = line.split(':')[0].strip()
-                dep = dep.split(' ')[0].strip()
-                dependencies.append(dep)
-                
-        return dependencies
+        if HAS_YAML:
+            try:
+                data = yaml.load(pubspec_content, Loader=YAML_LOADER) or {}
+                return list(data.get('dependencies') or {})
+            except yaml.YAMLError:
+                pass
+        
+        section = DEPENDENCIES_SECTION_RE.search(pubspec_content)
+        if not section:
+            return []
+        next_key = TOP_LEVEL_KEY_RE.search(pubspec_content, section.end())
+        end = next_key.start() if next_key else len(pubspec_content)
+        return DEPENDENCY_ENTRY_RE.findall(pubspec_content, section.end(), end)
         
     def create_git_commit(self, message: str, files: List[str] = None) -> bool:
         """Create a git commit with proper error handling"""
@@ -447,6 +817,24 @@ class MasterApp:
             self.log(f"Git push failed: {str(e)}", LogLevel.ERROR)
             return False
             
+    def commit_and_push(self, message: str, remote: str = "origin") -> bool:
+        """Commit staged changes and push them in a single git invocation"""
+        self.log(f"Committing and pushing to {remote}: {message}", LogLevel.INFO)
+        
+        if os.name == 'nt':
+            # cmd.exe quoting is unsafe for arbitrary messages, so run the two steps
+            return self.create_git_commit(message) and self.push_to_git(remote)
+        
+        # Message and remote are passed as positional args, never interpolated
+        script = 'git commit -m "$1" && git push "$2"'
+        result = self.run_command(["sh", "-c", script, "sh", message, remote], timeout=90)
+        
+        if result[0]:
+            self.log("Git commit and push completed successfully", LogLevel.INFO)
+        else:
+            self.log(f"Git commit and push failed: {result[1]}", LogLevel.ERROR)
+        return result[0]
+            
     def show_menu(self) -> None:
         """Display the main menu"""
         print("\n" + "="*60)
@@ -475,42 +863,34 @@ class MasterApp:
         print("="*60)
         
     def handle_menu_choice(self, choice: str) -> bool:
-        """Handle user menu choice"""
-        if choice == "1":
-            return self.build_project(BuildType.DEBUG)
-        elif choice == "2":
-            return self.clean_project()
-        elif choice == "3":
-            return self.run_project(BuildType.DEBUG)
-        elif choice == "4":
-            return self.run_tests()
-        elif choice == "5":
-            return self.analyze_code()
-        elif choice == "6":
-            return self.format_code()
-        elif choice == "7":
-            return self.upgrade_dependencies()
-        elif choice == "8":
-            return self.check_dependencies()
-        elif choice == "9":
-            info = self.get_project_info()
-            print("\n📋 Project Information:")
-            print("-" * 40)
-            for key, value in info.items():
-                print(f"  {key}: {value}")
-            print("-" * 40)
-            input("\nPress Enter to continue...")
-            return True
-        elif choice == "10":
-            self.show_git_menu()
-        elif choice == "11":
-            self.show_settings_menu()
-        elif choice == "12":
-            self.log("Exiting Master App", LogLevel.INFO)
-            return False
-        else:
-            print("❌ Invalid choice. Please try again.")
-            return True
+        """Handle user menu choice; only exit_app ends the main loop"""
+        handler, args = self._menu.get(choice, (self._invalid_choice, ()))
+        if handler == self.exit_app:
+            return handler(*args)
+        # Actions log their own failures; a failed build or test returns to the menu
+        handler(*args)
+        return True
+        
+    def show_project_info(self) -> bool:
+        """Print project information and wait for the user"""
+        info = self.get_project_info()
+        print("\n📋 Project Information:")
+        print("-" * 40)
+        for key, value in info.items():
+            print(f"  {key}: {value}")
+        print("-" * 40)
+        input("\nPress Enter to continue...")
+        return True
+        
+    def exit_app(self) -> bool:
+        """Stop the main loop"""
+        self.log("Exiting Master App", LogLevel.INFO)
+        return False
+        
+    def _invalid_choice(self) -> bool:
+        """Report an unknown menu choice and keep the loop running"""
+        print("❌ Invalid choice. Please try again.")
+        return True
             
     def show_git_menu(self) -> bool:
         """Display git operations menu"""
@@ -521,7 +901,8 @@ class MasterApp:
             "2. 📤 Push to Remote",
             "3. 🔀 Pull from Remote",
             "4. 📊 Check Status",
-            "5. 🔀 Back to Main Menu"
+            "5. 🚀 Commit and Push",
+            "6. 🔀 Back to Main Menu"
         ]
         
         for option in git_options:
@@ -529,20 +910,20 @@ class MasterApp:
         
         print("-" * 40)
         
-        choice = input("Select git operation (1-5): ").strip()
+        choice = input("Select git operation (1-6): ").strip()
         
         if choice == "1":
             message = input("Enter commit message: ").strip()
-            return self.create_git_commit(message)
+            success = self.create_git_commit(message)
         elif choice == "2":
-            return self.push_to_git()
+            success = self.push_to_git()
         elif choice == "3":
             pull_result = self.run_command(["git", "pull"], timeout=60)
             if pull_result[0]:
                 self.log("Git pull completed successfully", LogLevel.INFO)
             else:
                 self.log(f"Git pull failed: {pull_result[1]}", LogLevel.ERROR)
-            return pull_result[0]
+            success = pull_result[0]
         elif choice == "4":
             status_result = self.run_command(["git", "status"], timeout=30)
             if status_result[0]:
@@ -550,12 +931,19 @@ class MasterApp:
                 print(status_result[1])
             else:
                 self.log(f"Git status failed: {status_result[1]}", LogLevel.ERROR)
-            return status_result[0]
+            success = status_result[0]
         elif choice == "5":
+            message = input("Enter commit message: ").strip()
+            success = self.commit_and_push(message)
+        elif choice == "6":
             return True
         else:
             print("❌ Invalid choice. Please try again.")
             return True
+        
+        if not success:
+            self.log("Git operation did not complete; returning to main menu", LogLevel.WARNING)
+        return True
             
     def show_settings_menu(self) -> bool:
         """Display settings menu"""
@@ -574,87 +962,109 @@ class MasterApp:
         
         choice = input("Select setting to modify (1-9): ").strip()
         
-        if choice == "1":
-            platforms = ["windows", "macos", "linux", "web", "android", "ios"]
-            print("Available platforms:")
-            for i, platform in enumerate(platforms, 1):
-                print(f"  {i}. {platform}")
-            
-            new_platform = input(f"Enter platform ({'/'.join(platforms)}): ").strip()
-            if new_platform in platforms:
-                self.config.target_platform = new_platform
-                self.log(f"Target platform changed to: {new_platform}", LogLevel.INFO)
-            else:
-                print("❌ Invalid platform.")
-                
-        elif choice == "2":
-            build_types = ["debug", "release", "profile"]
-            print("Available build types:")
-            for i, build_type in enumerate(build_types, 1):
-                print(f"  {i}. {build_type}")
-            
-            new_build_type = input(f"Enter build type ({'/'.join(build_types)}): ").strip()
-            if new_build_type in build_types:
-                self.config.debug_build = (new_build_type == "debug")
-                self.log(f"Build type changed to: {new_build_type}", LogLevel.INFO)
-            else:
-                print("❌ Invalid build type.")
-                
-        elif choice == "3":
-            log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-            print("Available log levels:")
-            for i, level in enumerate(log_levels, 1):
-                print(f"  {i}. {level}")
-            
-            new_log_level = input(f"Enter log level ({'/'.join(log_levels)}): ").strip().upper()
-            if new_log_level in log_levels:
-                self.config.log_level = new_log_level
-                self.log(f"Log level changed to: {new_log_level}", LogLevel.INFO)
-            else:
-                print("❌ Invalid log level.")
-                
-        elif choice == "4":
-            self.config.log_to_file = not self.config.log_to_file
-            status = "Enabled" if self.config.log_to_file else "Disabled"
-            self.log(f"Log to file: {status}", LogLevel.INFO)
+        if choice == "9":
+            return True
+        handler = self._settings_menu.get(choice)
+        if handler is None:
+            print("❌ Invalid choice. Please try again.")
+        else:
+            handler()
+        return True
             
-        elif choice == "5":
-            self.config.log_to_console = not self.config.log_to_console
-            status = "Enabled" if self.config.log_to_console else "Disabled"
-            self.log(f"Log to console: {status}", LogLevel.INFO)
+    def _set_target_platform(self) -> None:
+        """Prompt for and set the target platform"""
+        platforms = ["windows", "macos", "linux", "web", "android", "ios"]
+        print("Available platforms:")
+        for i, platform in enumerate(platforms, 1):
+            print(f"  {i}. {platform}")
+        
+        new_platform = input(f"Enter platform ({'/'.join(platforms)}): ").strip()
+        if new_platform in platforms:
+            self.config.target_platform = new_platform
+            self.log(f"Target platform changed to: {new_platform}", LogLevel.INFO)
+        else:
+            print("❌ Invalid platform.")
             
-        elif choice == "6":
-            try:
-                new_time = int(input(f"Enter max build time (seconds) [current: {self.config.max_build_time}]: ").strip())
-                if new_time > 0:
-                    self.config.max_build_time = new_time
-                    self.log(f"Max build time changed to: {new_time}s", LogLevel.INFO)
-            except ValueError:
-                print("❌ Invalid number.")
-                
-        elif choice == "7":
-            try:
-                new_time = int(input(f"Enter max run time (seconds) [current: {self.config.max_run_time}]: ").strip())
-                if new_time > 0:
-                    self.config.max_run_time = new_time
-                    self.log(f"Max run time changed to: {new_time}s", LogLevel.INFO)
-            except ValueError:
-                print("❌ Invalid number.")
-                
-        elif choice == "8":
-            try:
-                new_limit = int(input(f"Enter memory limit (MB) [current: {self.config.memory_limit_mb}]: ").strip())
-                if new_limit > 0:
-                    self.config.memory_limit_mb = new_limit
-                    self.log(f"Memory limit changed to: {new_limit}MB", LogLevel.INFO)
-            except ValueError:
-                print("❌ Invalid number.")
-                
-        elif choice == "9":
-            return True
+    def _set_build_type(self) -> None:
+        """Prompt for and set the build type"""
+        build_types = ["debug", "release", "profile"]
+        print("Available build types:")
+        for i, build_type in enumerate(build_types, 1):
+            print(f"  {i}. {build_type}")
+        
+        new_build_type = input(f"Enter build type ({'/'.join(build_types)}): ").strip()
+        if new_build_type in build_types:
+            self.config.debug_build = (new_build_type == "debug")
+            self.log(f"Build type changed to: {new_build_type}", LogLevel.INFO)
         else:
-            print("❌ Invalid choice. Please try again.")
-            return True
+            print("❌ Invalid build type.")
+            
+    def _set_log_level(self) -> None:
+        """Prompt for and set the log level"""
+        log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+        print("Available log levels:")
+        for i, level in enumerate(log_levels, 1):
+            print(f"  {i}. {level}")
+        
+        new_log_level = input(f"Enter log level ({'/'.join(log_levels)}): ").strip().upper()
+        if new_log_level in log_levels:
+            self.config.log_level = new_log_level
+            self.log(f"Log level changed to: {new_log_level}", LogLevel.INFO)
+        else:
+            print("❌ Invalid log level.")
+            
+    def _toggle_log_to_file(self) -> None:
+        """Toggle logging to file"""
+        self.config.log_to_file = not self.config.log_to_file
+        self._set_handler_enabled(self._file_handler, self.config.log_to_file)
+        status = "Enabled" if self.config.log_to_file else "Disabled"
+        self.log(f"Log to file: {status}", LogLevel.INFO)
+            
+    def _toggle_log_to_console(self) -> None:
+        """Toggle logging to console"""
+        self.config.log_to_console = not self.config.log_to_console
+        self._set_handler_enabled(self._console_handler, self.config.log_to_console)
+        status = "Enabled" if self.config.log_to_console else "Disabled"
+        self.log(f"Log to console: {status}", LogLevel.INFO)
+            
+    def _set_handler_enabled(self, handler: logging.Handler, enabled: bool) -> None:
+        """Attach or detach a log output on the root logger"""
+        root = logging.getLogger()
+        if enabled:
+            root.addHandler(handler)
+        else:
+            handler.flush()
+            root.removeHandler(handler)
+            
+    def _set_max_build_time(self) -> None:
+        """Prompt for and set the max build time"""
+        try:
+            new_time = int(input(f"Enter max build time (seconds) [current: {self.config.max_build_time}]: ").strip())
+            if new_time > 0:
+                self.config.max_build_time = new_time
+                self.log(f"Max build time changed to: {new_time}s", LogLevel.INFO)
+        except ValueError:
+            print("❌ Invalid number.")
+            
+    def _set_max_run_time(self) -> None:
+        """Prompt for and set the max run time"""
+        try:
+            new_time = int(input(f"Enter max run time (seconds) [current: {self.config.max_run_time}]: ").strip())
+            if new_time > 0:
+                self.config.max_run_time = new_time
+                self.log(f"Max run time changed to: {new_time}s", LogLevel.INFO)
+        except ValueError:
+            print("❌ Invalid number.")
+            
+    def _set_memory_limit(self) -> None:
+        """Prompt for and set the memory limit"""
+        try:
+            new_limit = int(input(f"Enter memory limit (MB) [current: {self.config.memory_limit_mb}]: ").strip())
+            if new_limit > 0:
+                self.config.memory_limit_mb = new_limit
+                self.log(f"Memory limit changed to: {new_limit}MB", LogLevel.INFO)
+        except ValueError:
+            print("❌ Invalid number.")
             
     def run(self) -> None:
         """Main application loop"""
@@ -7,15 +7,131 @@ Python GUI application for building and running Flutter app with comprehensive l
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import subprocess
+import asyncio
+import shlex
+import shutil
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 import os
+import signal
 import sys
 import json
 from datetime import datetime
 from pathlib import Path
 import queue
+import logging
+import logging.handlers
 import webbrowser
+from collections import deque
+from functools import lru_cache
+
+# Optional fast JSON codec for the configuration file
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Maximum log messages inserted into the console per processing tick
+LOG_BATCH_SIZE = 500
+
+# Console line cap and how many lines to drop once it is exceeded
+MAX_LOG_LINES = 1000
+LOG_TRIM_LINES = 100
+
+# Longest single output line the subprocess stream reader accepts
+STREAM_LINE_LIMIT = 1024 * 1024
+
+# Start each command in its own process group so Stop reaches wrappers and their children
+PROCESS_GROUP_KWARGS = (
+    {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == 'nt'
+    else {'start_new_session': True}
+)
+
+# Seconds a stopped command's process group gets to exit before it is killed
+PROCESS_KILL_WAIT = 5
+
+# How often the metrics labels are refreshed (milliseconds)
+METRICS_INTERVAL_MS = 500
+
+# Console line layout
+LOG_FORMAT = '[%(asctime)s] [%(levelname)s] %(message)s'
+LOG_DATE_FORMAT = '%H:%M:%S'
+
+# This script runs standalone, so it keeps its own copies of isuite_master_app's JSON helpers;
+# they differ only in writing indented output for the hand-editable config file
+def dump_json_bytes(data):
+    """Serialize to indented UTF-8 JSON bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def load_json_bytes(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@lru_cache(maxsize=None)
+def _project_name():
+    """Name of the project directory the controller was started in"""
+    return os.path.basename(os.getcwd())
+
+@lru_cache(maxsize=None)
+def _config_path():
+    """Absolute path of the controller's configuration file"""
+    return os.path.abspath("master_app_config.json")
+
+def install_pidfd_child_watcher(loop):
+    """Make loop wait for child exit on a pidfd instead of a blocking thread per child"""
+    # Python 3.12+ already does this; older versions default to ThreadedChildWatcher
+    if sys.version_info >= (3, 12) or not hasattr(os, 'pidfd_open'):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return  # kernel older than 5.3
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(loop)
+    asyncio.set_child_watcher(watcher)
+
+def signal_process_tree(pid, force=False):
+    """Terminate (or with force, kill) a process started with PROCESS_GROUP_KWARGS and its descendants"""
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/T', '/F', '/PID', str(pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+    try:
+        os.killpg(pid, signal.SIGKILL if force else signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime once per second instead of once per record"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ts_cache = (None, "")
+        
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime(datefmt or LOG_DATE_FORMAT, self.converter(sec)))
+        return self._ts_cache[1]
+
+class TkConsoleHandler(logging.Handler):
+    """Logging handler that hands formatted records to the controller's console"""
+    
+    def __init__(self, controller):
+        super().__init__()
+        self.controller = controller
+        
+    def emit(self, record):
+        try:
+            self.controller.enqueue_console_message(self.format(record))
+        except Exception:
+            self.handleError(record)
 
 class MasterAppController:
     def __init__(self):
@@ -30,20 +146,65 @@ class MasterAppController:
         self.build_process = None
         self.run_process = None
         
-        # Logging queue
+        # Command subprocesses currently running on the loop thread, each with its stop event
+        self._running_processes = {}
+        
+        # Cached `flutter --version` result and the SDK stamp it was taken at
+        self.flutter_version = None
+        self.flutter_mtime = None
+        
+        # Last loaded configuration and its file mtime; save_configuration merges into it
+        self._config = {}
+        self._config_mtime = None
+        
+        # Single background event loop that runs every command subprocess
+        self.loop = asyncio.new_event_loop()
+        install_pidfd_child_watcher(self.loop)
+        threading.Thread(target=self.loop.run_forever, name="isuite-commands", daemon=True).start()
+        self._current_future = None
+        
+        # Shared workers for blocking helpers (e.g. the Flutter version check)
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='isuite')
+        
+        # Logging queue: log_message enqueues records, a listener thread formats them
         self.log_queue = queue.Queue()
+        self.logger = logging.getLogger('master_app_controller')
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.addHandler(logging.handlers.QueueHandler(self.log_queue))
+        
+        # Formatted messages waiting for the Tk thread (deque append/popleft need no lock)
+        self._pending_logs = deque()
+        self._flush_scheduled = False
+        
+        # Callables queued by worker threads for the Tk thread, plus the self-pipe that wakes it
+        self._ui_calls = deque()
+        self._wake_r = self._wake_w = None
+        self._wake_lock = threading.Lock()
+        self._wake_closed = False
+        
+        # Most recent console lines, used for saving and searching
+        self._log_ring = deque(maxlen=MAX_LOG_LINES)
         
         # Metrics
-        self.start_time = datetime.now()
+        self._start_ts = time.monotonic()
+        self._last_uptime_s = -1
         self.build_count = 0
         self.error_count = 0
         self.warning_count = 0
+        self._metrics_dirty = True
+        self._rendered_metrics = {}
         
         # Setup UI
         self.setup_ui()
+        self.setup_ui_wakeup()
+        self._tick_metrics()
         
         # Start log processing
-        self.process_logs()
+        console_handler = TkConsoleHandler(self)
+        console_handler.setFormatter(CachedTimeFormatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+        self.log_listener = logging.handlers.QueueListener(self.log_queue, console_handler)
+        self.log_listener.start()
         
         # Load configuration
         self.load_configuration()
@@ -285,6 +446,7 @@ class MasterAppController:
             wrap=tk.WORD
         )
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.log_text.tag_config('match', background='yellow', foreground='black')
         
         # Configure grid weights
         log_frame.columnconfigure(0, weight=1)
@@ -349,110 +511,198 @@ class MasterAppController:
         # Project info
         project_info = ttk.Label(
             status_frame,
-            text=f"Project: {os.path.basename(os.getcwd())}",
+            text=f"Project: {_project_name()}",
             font=('Arial', 9)
         )
         project_info.grid(row=0, column=2, padx=10)
         
-        # Flutter info
-        flutter_info = ttk.Label(
+        # Flutter info (filled from the cached version or a check in load_configuration)
+        self.flutter_info = ttk.Label(
             status_frame,
             text="Flutter: Checking...",
             font=('Arial', 9)
         )
-        flutter_info.grid(row=0, column=3, padx=10)
-        
-        # Check Flutter version
-        self.check_flutter_version(flutter_info)
+        self.flutter_info.grid(row=0, column=3, padx=10)
         
     def log_message(self, message, level="INFO"):
         """Add message to log queue"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] [{level}] {message}"
-        self.log_queue.put(formatted_message)
+        self.logger.log(getattr(logging, level), message)
         
-        # Update metrics
+        # Update metrics (rendered by the next metrics tick)
         if level == "ERROR":
             self.error_count += 1
-            self.update_metrics()
+            self._metrics_dirty = True
         elif level == "WARNING":
             self.warning_count += 1
-            self.update_metrics()
+            self._metrics_dirty = True
+            
+    def enqueue_console_message(self, message):
+        """Queue a formatted message for the console and wake the Tk thread if idle"""
+        self._pending_logs.append(message)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.call_in_ui(self.process_logs)
             
+    def setup_ui_wakeup(self):
+        """Let worker threads wake the Tk thread through a self-pipe"""
+        # Tk on Windows has no file handlers; call_in_ui falls back to after() there
+        if not hasattr(self.root.tk, 'createfilehandler') or os.name == 'nt':
+            return
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self.root.tk.createfilehandler(self._wake_r, tk.READABLE, self._on_wake)
+        
+    def call_in_ui(self, func):
+        """Run func on the Tk thread; safe to call from any thread"""
+        self._ui_calls.append(func)
+        # The lock keeps on_closing from closing the pipe between the check and the write
+        with self._wake_lock:
+            if self._wake_closed:
+                return
+            if self._wake_w is None:
+                self.root.after(0, self._drain_ui_calls)
+                return
+            try:
+                os.write(self._wake_w, b'x')
+            except BlockingIOError:
+                pass  # pipe full: a wakeup is already pending
+            except OSError as e:
+                self.logger.warning(f"Could not wake the UI thread: {e}")
+            
+    def _on_wake(self, fd, mask):
+        """Tk file handler for the wakeup pipe"""
+        os.read(fd, 4096)
+        self._drain_ui_calls()
+        
+    def _drain_ui_calls(self):
+        """Run every callable queued by worker threads"""
+        while True:
+            try:
+                func = self._ui_calls.popleft()
+            except IndexError:
+                break
+            try:
+                func()
+            except Exception:
+                self.logger.exception("Error in UI callback")
+        
     def process_logs(self):
         """Process log messages from queue"""
         try:
-            while True:
-                try:
-                    message = self.log_queue.get_nowait()
-                    self.log_text.insert(tk.END, message + "\n")
-                    
-                    # Auto-scroll if enabled
-                    if self.auto_scroll_var.get():
-                        self.log_text.see(tk.END)
-                        
-                    # Limit log size
-                    if self.log_text.index('end-1c').split('.')[0] > '1000':
-                        self.log_text.delete('1.0', '100.0')
-                        
-                except queue.Empty:
-                    break
-                    
-        except Exception as e:
-            print(f"Error processing logs: {e}")
+            # Clear the flag before draining so a message appended meanwhile schedules a new pass
+            self._flush_scheduled = False
             
-        # Schedule next processing
-        self.root.after(100, self.process_logs)
-        
-    def execute_command(self, command, description="Executing command"):
-        """Execute a command in a separate thread"""
-        def run_command():
+            # Take a batch and insert it with a single Tk call
+            messages = []
             try:
-                self.log_message(f"🚀 {description}", "INFO")
-                self.log_message(f"Command: {command}", "INFO")
+                while len(messages) < LOG_BATCH_SIZE:
+                    messages.append(self._pending_logs.popleft())
+            except IndexError:
+                pass
                 
-                # Update UI
-                self.root.after(0, lambda: self.update_status(f"Running: {description}"))
-                self.root.after(0, lambda: self.progress_bar.start())
+            if self._pending_logs and not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.root.after_idle(self.process_logs)
                 
-                # Execute command
-                process = subprocess.Popen(
-                    command,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
+
+            if messages:
+                self._log_ring.extend(messages)
+                self.log_text.insert(tk.END, "\n".join(messages) + "\n")
                 
-                # Read output line by line
-                for line in process.stdout:
-                    self.log_message(line.strip())
+                # Limit log size
+                line_count = int(self.log_text.index('end-1c').split('.')[0])
+                if line_count > MAX_LOG_LINES:
+                    self.log_text.delete('1.0', f'{line_count - MAX_LOG_LINES + LOG_TRIM_LINES}.0')
                     
-                # Wait for completion
-                process.wait()
-                
-                # Update UI
-                self.root.after(0, lambda: self.progress_bar.stop())
-                self.root.after(0, lambda: self.update_status("Ready"))
-                
-                if process.returncode == 0:
-                    self.log_message(f"✅ {description} completed successfully", "INFO")
-                    self.build_count += 1
-                    self.update_metrics()
-                else:
-                    self.log_message(f"❌ {description} failed with exit code {process.returncode}", "ERROR")
+                # Auto-scroll if enabled
+                if self.auto_scroll_var.get():
+                    self.log_text.see(tk.END)
                     
-            except Exception as e:
-                self.log_message(f"💥 Error executing {description}: {str(e)}", "ERROR")
-                self.root.after(0, lambda: self.progress_bar.stop())
-                self.root.after(0, lambda: self.update_status("Error"))
-                
-        # Run in separate thread
-        thread = threading.Thread(target=run_command, daemon=True)
-        thread.start()
+        except Exception as e:
+            print(f"Error processing logs: {e}")
+        
+    def execute_command(self, command, description="Executing command"):
+        """Execute a command on the background event loop"""
+        self._current_future = asyncio.run_coroutine_threadsafe(self._run_command(command, description), self.loop)
         
+    async def _run_command(self, command, description):
+        """Run a command without a shell, streaming its output to the log"""
+        process = None
+        finished = False
+        try:
+            self.log_message(f"🚀 {description}", "INFO")
+            self.log_message(f"Command: {command}", "INFO")
+            
+            # Update UI
+            self.call_in_ui(lambda: self.update_status(f"Running: {description}"))
+            self.call_in_ui(lambda: self.progress_bar.start())
+            
+            # Execute command (resolve e.g. flutter.bat on Windows, which CreateProcess won't)
+            args = shlex.split(command, posix=(os.name != 'nt'))
+            args[0] = shutil.which(args[0]) or args[0]
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=STREAM_LINE_LIMIT,
+                **PROCESS_GROUP_KWARGS
+            )
+            stop_requested = asyncio.Event()
+            self._running_processes[process] = stop_requested
+            
+            async def read_output():
+                async for line in process.stdout:
+                    self.log_message(line.decode('utf-8', errors='replace').strip())
+                await process.wait()
+            
+            # Read output line by line until the command ends or Stop is pressed
+            reader = asyncio.ensure_future(read_output())
+            stopper = asyncio.ensure_future(stop_requested.wait())
+            try:
+                await asyncio.wait({reader, stopper}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                stopper.cancel()
+                stopped = not reader.done()
+                if stopped:
+                    reader.cancel()
+            
+            # Update UI
+            self.call_in_ui(lambda: self.progress_bar.stop())
+            self.call_in_ui(lambda: self.update_status("Ready"))
+            
+            if stopped:
+                self.log_message(f"🛑 {description} stopped", "INFO")
+                return
+            reader.result()
+            finished = True
+            
+            if process.returncode == 0:
+                self.log_message(f"✅ {description} completed successfully", "INFO")
+                self.build_count += 1
+                self._metrics_dirty = True
+            else:
+                self.log_message(f"❌ {description} failed with exit code {process.returncode}", "ERROR")
+                
+        except Exception as e:
+            self.log_message(f"💥 Error executing {description}: {str(e)}", "ERROR")
+            self.call_in_ui(lambda: self.progress_bar.stop())
+            self.call_in_ui(lambda: self.update_status("Error"))
+        finally:
+            # Never leave the process group running, whether we were stopped, failed,
+            # were cancelled or hit a long line; every wait here is bounded
+            if process is not None:
+                if not finished:
+                    signal_process_tree(process.pid)
+                    try:
+                        await asyncio.wait_for(process.wait(), PROCESS_KILL_WAIT)
+                    except asyncio.TimeoutError:
+                        signal_process_tree(process.pid, force=True)
+                        try:
+                            await asyncio.wait_for(process.wait(), PROCESS_KILL_WAIT)
+                        except asyncio.TimeoutError:
+                            process._transport.close()
+                self._running_processes.pop(process, None)
+            
     def build_app(self):
         """Build the Flutter app"""
         self.execute_command("flutter build", "Building Flutter app")
@@ -503,6 +753,13 @@ class MasterAppController:
         
     def stop_operations(self):
         """Stop all running operations"""
+        running = list(self._running_processes.values())
+        for stop_requested in running:
+            # The event belongs to the loop thread; _run_command then terminates the process group
+            self.loop.call_soon_threadsafe(stop_requested.set)
+        if running:
+            self.log_message("🛑 Process stopped", "INFO")
+            
         if self.build_process:
             self.build_process.terminate()
             self.build_process = None
@@ -523,6 +780,7 @@ class MasterAppController:
     def clear_logs(self):
         """Clear log console"""
         self.log_text.delete('1.0', tk.END)
+        self._log_ring.clear()
         self.log_message("🗑️ Logs cleared", "INFO")
         
     def save_logs(self):
@@ -531,8 +789,8 @@ class MasterAppController:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"isuite_logs_{timestamp}.txt"
             
-            with open(filename, 'w') as f:
-                f.write(self.log_text.get('1.0', tk.END))
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write("\n".join(self._log_ring) + "\n")
                 
             self.log_message(f"💾 Logs saved to {filename}", "INFO")
             messagebox.showinfo("Success", f"Logs saved to {filename}")
@@ -547,31 +805,21 @@ class MasterAppController:
         if not search_term:
             return
             
-        # Simple search implementation
-        content = self.log_text.get('1.0', tk.END)
-        lines = content.split('\n')
-        
-        matching_lines = []
-        for i, line in enumerate(lines, 1):
-            if search_term.lower() in line.lower():
-                matching_lines.append(f"Line {i}: {line}")
-                
-        if matching_lines:
-            # Show search results in a new window
-            search_window = tk.Toplevel(self.root)
-            search_window.title("Search Results")
-            search_window.geometry("800x600")
-            
-            search_text = scrolledtext.ScrolledText(
-                search_window,
-                bg='#1e1e1e',
-                fg='#00ff00',
-                font=('Consolas', 10)
-            )
-            search_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            search_text.insert('1.0', '\n'.join(matching_lines))
+        # Highlight matches in place using Tk's own text search
+        self.log_text.tag_remove('match', '1.0', tk.END)
+        matches = []
+        start = '1.0'
+        while True:
+            index = self.log_text.search(search_term, start, stopindex=tk.END, nocase=True)
+            if not index:
+                break
+            start = f"{index}+{len(search_term)}c"
+            self.log_text.tag_add('match', index, start)
+            matches.append(index)
             
+        if matches:
+            self.log_text.see(matches[0])
+            self.update_status(f"Search: {len(matches)} match(es) for '{search_term}'")
         else:
             messagebox.showinfo("Search Results", "No matches found")
             
@@ -581,14 +829,44 @@ class MasterAppController:
         
     def update_metrics(self):
         """Update metrics display"""
-        uptime = datetime.now() - self.start_time
-        hours, remainder = divmod(uptime.total_seconds(), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        
-        self.uptime_label.config(text=f"Uptime: {int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}")
-        self.builds_label.config(text=f"Builds: {self.build_count}")
-        self.errors_label.config(text=f"Errors: {self.error_count}")
-        
+        uptime_s = int(time.monotonic() - self._start_ts)
+        if uptime_s != self._last_uptime_s:
+            self._last_uptime_s = uptime_s
+            hours, remainder = divmod(uptime_s, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            self._set_metric(self.uptime_label, f"Uptime: {hours:02d}:{minutes:02d}:{seconds:02d}")
+            
+        if self._metrics_dirty:
+            self._metrics_dirty = False
+            self._set_metric(self.builds_label, f"Builds: {self.build_count}")
+            self._set_metric(self.errors_label, f"Errors: {self.error_count}")
+            
+    def _set_metric(self, label, text):
+        """Update a metrics label only when its text changed"""
+        if self._rendered_metrics.get(label) != text:
+            self._rendered_metrics[label] = text
+            label.config(text=text)
+            
+    def _tick_metrics(self):
+        """Refresh the metrics display periodically, coalescing updates in between"""
+        self.update_metrics()
+        self.root.after(METRICS_INTERVAL_MS, self._tick_metrics)
+        
+    def flutter_sdk_mtime(self):
+        """Modification stamp of the Flutter SDK on PATH, or None if not found"""
+        flutter = shutil.which("flutter")
+        if not flutter:
+            return None
+        try:
+            # bin/cache is rewritten whenever the SDK is upgraded
+            cache_dir = os.path.join(os.path.dirname(os.path.realpath(flutter)), "cache")
+            mtime = os.stat(flutter).st_mtime
+            if os.path.isdir(cache_dir):
+                mtime = max(mtime, os.stat(cache_dir).st_mtime)
+            return mtime
+        except OSError:
+            return None
+            
     def check_flutter_version(self, label):
         """Check Flutter version"""
         def check_version():
@@ -601,23 +879,35 @@ class MasterAppController:
                 )
                 if result.returncode == 0:
                     version = result.stdout.split('\n')[0]
-                    self.root.after(0, lambda: label.config(text=f"Flutter: {version}"))
+                    self.flutter_version = version
+                    self.flutter_mtime = self.flutter_sdk_mtime()
+                    self.call_in_ui(lambda: label.config(text=f"Flutter: {version}"))
                 else:
-                    self.root.after(0, lambda: label.config(text="Flutter: Not found"))
+                    self.call_in_ui(lambda: label.config(text="Flutter: Not found"))
             except Exception:
-                self.root.after(0, lambda: label.config(text="Flutter: Error checking"))
+                self.call_in_ui(lambda: label.config(text="Flutter: Error checking"))
                 
-        thread = threading.Thread(target=check_version, daemon=True)
-        thread.start()
+        self._pool.submit(check_version)
         
     def load_configuration(self):
         """Load configuration from file"""
-        config_file = "master_app_config.json"
-        if os.path.exists(config_file):
+        config_file = _config_path()
+        config = {}
+        try:
+            mtime = os.stat(config_file).st_mtime
+        except OSError:
+            mtime = None
+            
+        if mtime is not None:
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    
+                # Only parse the file again if it changed since it was last read
+                if mtime == self._config_mtime:
+                    config = self._config
+                else:
+                    with open(config_file, 'rb') as f:
+                        config = load_json_bytes(f.read())
+                    self._config, self._config_mtime = config, mtime
+                
                 # Apply configuration
                 if 'auto_scroll' in config:
                     self.auto_scroll_var.set(config['auto_scroll'])
@@ -627,19 +917,36 @@ class MasterAppController:
             except Exception as e:
                 self.log_message(f"💥 Error loading configuration: {str(e)}", "ERROR")
                 
+        # Reuse the cached Flutter version unless the SDK changed since it was taken
+        flutter_mtime = self.flutter_sdk_mtime()
+        if config.get('flutter_version') and flutter_mtime is not None and config.get('flutter_mtime') == flutter_mtime:
+            self.flutter_version = config['flutter_version']
+            self.flutter_mtime = flutter_mtime
+            self.flutter_info.config(text=f"Flutter: {self.flutter_version}")
+        else:
+            self.check_flutter_version(self.flutter_info)
+                
     def save_configuration(self):
         """Save configuration to file"""
         config = {
+            **self._config,
             'auto_scroll': self.auto_scroll_var.get(),
             'last_run': datetime.now().isoformat(),
             'build_count': self.build_count,
             'error_count': self.error_count,
+            'flutter_version': self.flutter_version,
+            'flutter_mtime': self.flutter_mtime,
         }
         
         try:
-            with open("master_app_config.json", 'w') as f:
-                json.dump(config, f, indent=2)
-                
+            # Write to a temporary file and swap it in so a crash can't truncate the config
+            config_file = _config_path()
+            temp_file = config_file + ".tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(dump_json_bytes(config))
+            os.replace(temp_file, config_file)
+            self._config, self._config_mtime = config, os.stat(config_file).st_mtime
+            
         except Exception as e:
             self.log_message(f"💥 Error saving configuration: {str(e)}", "ERROR")
             
@@ -647,6 +954,18 @@ class MasterAppController:
         """Handle window closing"""
         self.save_configuration()
         self.stop_operations()
+        self.log_listener.stop()
+        if self._current_future:
+            self._current_future.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        with self._wake_lock:
+            self._wake_closed = True
+            if self._wake_r is not None:
+                self.root.tk.deletefilehandler(self._wake_r)
+                os.close(self._wake_r)
+                os.close(self._wake_w)
+                self._wake_r = self._wake_w = None
         self.root.destroy()
         
     def run(self):